@@ -10,7 +10,7 @@ from datetime import datetime, timedelta
 import uuid
 import re
 
-from app.database import get_db
+from app.database import get_db, uuid7
 from app.models.user import User
 from app.models.organization import Organization
 from app.models.organization_user import OrganizationUser
@@ -23,7 +23,7 @@ from app.schemas.auth import (
     OrganizationInfo,
 )
 from app.services.auth import AuthService
-from app.dependencies.auth import get_current_user, AuthContext
+from app.dependencies.auth import get_current_user_with_records, AuthContext
 
 
 router = APIRouter(prefix="/api/v1/auth", tags=["authentication"])
@@ -86,7 +86,7 @@ async def register(
 
     # Create organization
     organization = Organization(
-        id=uuid.uuid4(),
+        id=uuid7(),
         name=request.organization_name,
         slug=slug,
         plan_tier='starter',
@@ -117,7 +117,7 @@ async def register(
 
     # Create organization-user relationship
     org_user = OrganizationUser(
-        id=uuid.uuid4(),
+        id=uuid7(),
         organization_id=organization.id,
         user_id=user.id,
         role='owner',
@@ -257,7 +257,7 @@ async def login(
 
 @router.get("/me")
 async def get_current_user_info(
-    auth: AuthContext = Depends(get_current_user)
+    auth: AuthContext = Depends(get_current_user_with_records)
 ):
     """
     Get current authenticated user's information.
@@ -289,7 +289,7 @@ async def get_current_user_info(
 @router.put("/profile")
 async def update_profile(
     profile_data: dict,
-    auth: AuthContext = Depends(get_current_user),
+    auth: AuthContext = Depends(get_current_user_with_records),
     db: AsyncSession = Depends(get_db),
 ):
     """Update user profile information."""
@@ -318,7 +318,7 @@ async def update_profile(
 @router.post("/change-password")
 async def change_password(
     password_data: dict,
-    auth: AuthContext = Depends(get_current_user),
+    auth: AuthContext = Depends(get_current_user_with_records),
     db: AsyncSession = Depends(get_db),
 ):
     """Change user password."""
@@ -5,8 +5,9 @@ Provides CRUD operations for pool service customers.
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, or_, update, bindparam
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import Optional
 from uuid import UUID
 
@@ -18,13 +19,38 @@ from app.schemas.customer import (
     CustomerCreate,
     CustomerUpdate,
     CustomerResponse,
-    CustomerListResponse
+    CustomerListResponse,
+    CustomerCoordinatesUpdate
 )
+from app.services.cache import tech_routes_cache
 from app.services.geocoding import geocoding_service
 
 router = APIRouter(prefix="/api/customers", tags=["customers"])
 
 
+def _default_display_name(
+    service_type: str,
+    name: Optional[str],
+    first_name: Optional[str],
+    last_name: Optional[str]
+) -> str:
+    """
+    Build the display name used when the client does not provide one.
+
+    Args:
+        service_type: residential or commercial
+        name: Business name
+        first_name: First name (residential)
+        last_name: Last name (residential)
+
+    Returns:
+        "Last, First" for residential customers, otherwise the business name
+    """
+    if service_type == 'residential':
+        return f"{last_name or ''}, {first_name or ''}".strip(', ')
+    return name or 'Unnamed'
+
+
 @router.post(
     "/",
     response_model=CustomerResponse,
@@ -58,14 +84,12 @@ async def create_customer(
 
     # Auto-generate display_name if not provided
     if not customer_data.get('display_name'):
-        if customer_data['service_type'] == 'residential':
-            # For residential: "Last, First"
-            last = customer_data.get('last_name', '')
-            first = customer_data.get('first_name', '')
-            customer_data['display_name'] = f"{last}, {first}".strip(', ')
-        else:
-            # For commercial: use name
-            customer_data['display_name'] = customer_data.get('name', 'Unnamed')
+        customer_data['display_name'] = _default_display_name(
+            customer_data['service_type'],
+            customer_data.get('name'),
+            customer_data.get('first_name'),
+            customer_data.get('last_name')
+        )
 
     db_customer = Customer(**customer_data)
 
@@ -76,6 +100,7 @@ async def create_customer(
 
     db.add(db_customer)
     await db.commit()
+    tech_routes_cache.invalidate_organization(auth.organization_id)
     await db.refresh(db_customer)
     return db_customer
 
@@ -103,8 +128,9 @@ async def list_customers(
     - **service_type**: Filter by residential or commercial
     - **is_active**: Filter by active/inactive status
     """
-    # Build base query with eager loading of assigned_tech
-    query = select(Customer).options(selectinload(Customer.assigned_tech))
+    # Build base query with eager loading of assigned_tech; any other
+    # relationship access raises instead of issuing a query per customer
+    query = select(Customer).options(selectinload(Customer.assigned_tech), raiseload("*"))
 
     # Filter by organization
     query = query.where(Customer.organization_id == auth.organization_id)
@@ -160,7 +186,7 @@ async def list_customers(
 
     # Execute query
     result = await db.execute(query)
-    customers = list(result.scalars().all())
+    customers = result.scalars().all()
 
     # Initialize has_temp_assignment flag for all customers
     for customer in customers:
@@ -181,19 +207,27 @@ async def list_customers(
         temp_result = await db.execute(temp_assignments_query)
         temp_assignments = {ta.customer_id: ta for ta in temp_result.scalars().all()}
 
-        # Override assigned_tech for customers with temp assignments
+        # Load every temp-assigned tech in one query
+        temp_techs = {}
+        if temp_assignments:
+            tech_result = await db.execute(
+                select(Tech)
+                .options(raiseload("*"))
+                .where(Tech.id.in_({ta.tech_id for ta in temp_assignments.values()}))
+            )
+            temp_techs = {tech.id: tech for tech in tech_result.scalars().all()}
+
+        # Override assigned_tech for customers with temp assignments. The
+        # override is for this response only, so it is set as committed state
+        # rather than a pending change an autoflush would write back.
         for customer in customers:
-            if customer.id in temp_assignments:
-                temp_assignment = temp_assignments[customer.id]
-                # Load the tech for the temp assignment
-                tech_query = select(Tech).where(Tech.id == temp_assignment.tech_id)
-                tech_result = await db.execute(tech_query)
-                temp_tech = tech_result.scalar_one_or_none()
-                if temp_tech:
-                    customer.assigned_tech = temp_tech
-                    customer.assigned_tech_id = temp_tech.id
-                    # Mark customer as having a temp assignment
-                    customer.has_temp_assignment = True
+            temp_assignment = temp_assignments.get(customer.id)
+            temp_tech = temp_techs.get(temp_assignment.tech_id) if temp_assignment else None
+            if temp_tech:
+                set_committed_value(customer, "assigned_tech", temp_tech)
+                set_committed_value(customer, "assigned_tech_id", temp_tech.id)
+                # Mark customer as having a temp assignment
+                customer.has_temp_assignment = True
 
     return CustomerListResponse(
         customers=customers,
@@ -337,14 +371,12 @@ async def update_customer(
     # Auto-generate display_name if name fields changed but display_name not explicitly provided
     name_fields_changed = any(f in update_data for f in ['name', 'first_name', 'last_name'])
     if name_fields_changed and 'display_name' not in update_data:
-        if customer.service_type == 'residential':
-            # For residential: "Last, First"
-            last = customer.last_name or ''
-            first = customer.first_name or ''
-            customer.display_name = f"{last}, {first}".strip(', ')
-        else:
-            # For commercial: use name
-            customer.display_name = customer.name or 'Unnamed'
+        customer.display_name = _default_display_name(
+            customer.service_type,
+            customer.name,
+            customer.first_name,
+            customer.last_name
+        )
 
     # Re-geocode if address changed (but not if latitude/longitude were explicitly provided)
     if "address" in update_data and "latitude" not in update_data and "longitude" not in update_data:
@@ -353,6 +385,7 @@ async def update_customer(
             customer.latitude, customer.longitude = coordinates
 
     await db.commit()
+    tech_routes_cache.invalidate_organization(auth.organization_id)
     await db.refresh(customer)
     return customer
 
@@ -387,6 +420,60 @@ async def delete_customer(
 
     await db.delete(customer)
     await db.commit()
+    tech_routes_cache.invalidate_organization(auth.organization_id)
+
+
+@router.post(
+    "/coordinates",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Apply corrected coordinates to many customers"
+)
+async def update_customer_coordinates(
+    coordinates: CustomerCoordinatesUpdate,
+    auth: AuthContext = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Set latitude/longitude for many customers in one statement.
+
+    Intended for applying the corrections reported by
+    /api/customers/validate-coordinates. Every customer must belong to the
+    organization, otherwise nothing is updated.
+    """
+    # Last entry wins if a customer is listed twice
+    by_id = {c.id: c for c in coordinates.customers}
+
+    result = await db.execute(
+        select(func.count())
+        .select_from(Customer)
+        .where(Customer.id.in_(by_id.keys()))
+        .where(Customer.organization_id == auth.organization_id)
+    )
+    if result.scalar_one() != len(by_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="One or more customers not found"
+        )
+
+    # One executemany UPDATE (asyncpg sends the parameter sets in a single
+    # batch) instead of loading and flushing each customer
+    await db.execute(
+        update(Customer.__table__)
+        .where(Customer.__table__.c.id == bindparam("b_id"))
+        .where(Customer.__table__.c.organization_id == bindparam("b_organization_id"))
+        .values(latitude=bindparam("b_latitude"), longitude=bindparam("b_longitude")),
+        [
+            {
+                "b_id": c.id,
+                "b_organization_id": auth.organization_id,
+                "b_latitude": c.latitude,
+                "b_longitude": c.longitude,
+            }
+            for c in by_id.values()
+        ]
+    )
+    await db.commit()
+    tech_routes_cache.invalidate_organization(auth.organization_id)
 
 
 @router.get(
@@ -11,8 +11,10 @@ import io
 from typing import List
 
 from app.database import get_db
+from app.dependencies.auth import get_current_user, AuthContext
 from app.models.customer import Customer
 from app.schemas.customer import CustomerResponse
+from app.services.cache import tech_routes_cache
 from app.services.geocoding import geocoding_service
 import logging
 
@@ -29,6 +31,7 @@ router = APIRouter(prefix="/api/imports", tags=["imports"])
 async def import_customers_csv(
     file: UploadFile = File(...),
     geocode: bool = True,
+    auth: AuthContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -183,6 +186,7 @@ async def import_customers_csv(
                 # Check if customer already exists
                 existing = await db.execute(
                     select(Customer).where(
+                        Customer.organization_id == auth.organization_id,
                         Customer.name == client,
                         Customer.address == full_address
                     )
@@ -197,7 +201,9 @@ async def import_customers_csv(
 
                 # Create single customer record with schedule info
                 customer = Customer(
+                    organization_id=auth.organization_id,
                     name=client,
+                    display_name=client,
                     address=full_address,
                     service_type=service_type,
                     service_day=primary_day,
@@ -229,6 +235,7 @@ async def import_customers_csv(
 
         # Commit all at once
         await db.commit()
+        tech_routes_cache.invalidate_organization(auth.organization_id)
 
         result = {
             "status": "completed",
@@ -6,7 +6,7 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
@@ -49,13 +49,15 @@ async def list_issues(
     - status: Filter by status (pending, scheduled, in_progress, resolved, closed)
     - severity: Filter by severity (low, medium, high, critical)
     """
+    # Any relationship not loaded here raises instead of querying per issue
     query = (
         select(Issue)
         .options(
             selectinload(Issue.customer),
             selectinload(Issue.reported_by),
             selectinload(Issue.assigned_tech),
-            selectinload(Issue.resolved_by)
+            selectinload(Issue.resolved_by),
+            raiseload("*")
         )
         .where(Issue.organization_id == auth.organization_id)
     )
@@ -174,11 +176,10 @@ async def create_issue(
     )
     db.add(issue)
     await db.commit()
+    # The customer and tech relationships are joined-eager, so one refresh
+    # loads them too
     await db.refresh(issue)
 
-    # Load relationships
-    await db.refresh(issue, ["customer", "reported_by"])
-
     issue_response = IssueResponse.model_validate(issue)
     issue_response.customer_name = issue.customer.display_name
     issue_response.customer_address = issue.customer.address
@@ -237,9 +238,6 @@ async def update_issue(
     await db.commit()
     await db.refresh(issue)
 
-    # Load relationships
-    await db.refresh(issue, ["customer", "reported_by", "assigned_tech", "resolved_by"])
-
     issue_response = IssueResponse.model_validate(issue)
     issue_response.customer_name = issue.customer.display_name
     issue_response.customer_address = issue.customer.address
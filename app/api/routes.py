@@ -4,17 +4,18 @@ Provides route generation and management operations.
 """
 
 import logging
-import traceback
+from collections import defaultdict
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, update, delete, func, or_
+from sqlalchemy.orm import joinedload, raiseload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import Optional
 from uuid import UUID
-from datetime import date, timedelta
+from datetime import date
 
-from app.database import get_db
+from app.database import get_db, require_transaction, uuid7
 from app.dependencies.auth import get_current_user, AuthContext
 from app.models.customer import Customer
 from app.models.tech import Tech
@@ -27,6 +28,7 @@ from app.schemas.route import (
     RouteSaveRequest,
     SavedRouteResponse
 )
+from app.services.cache import tech_routes_cache
 from app.services.optimization import optimization_service
 from app.services.pdf_export import pdf_export_service
 from app.services.tech_routing import tech_routing_service
@@ -35,6 +37,24 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/routes", tags=["routes"])
 
+# Service day -> two-letter code used in Customer.service_schedule (e.g. "Mo/Th")
+DAY_ABBREV_MAP = {
+    'monday': 'Mo', 'tuesday': 'Tu', 'wednesday': 'We',
+    'thursday': 'Th', 'friday': 'Fr', 'saturday': 'Sa', 'sunday': 'Su'
+}
+
+# Columns needed to render a route stop (fetched as plain rows, not ORM objects)
+STOP_DETAIL_COLUMNS = (
+    RouteStop.sequence,
+    RouteStop.estimated_service_duration,
+    Customer.id.label("customer_id"),
+    Customer.name.label("customer_name"),
+    Customer.address,
+    Customer.service_type,
+    Customer.latitude,
+    Customer.longitude,
+)
+
 
 @router.post(
     "/optimize",
@@ -62,11 +82,12 @@ async def optimize_routes(
     - Day assignment locks
     """
     logger.info(
-        f"Optimization request: scope={request.optimization_scope}, "
-        f"selected_techs={request.selected_tech_ids}, "
-        f"service_day={request.service_day}, "
-        f"mode={request.optimization_mode}, "
-        f"speed={request.optimization_speed}"
+        "Optimization request: scope=%s, selected_techs=%s, service_day=%s, mode=%s, speed=%s",
+        request.optimization_scope,
+        request.selected_tech_ids,
+        request.service_day,
+        request.optimization_mode,
+        request.optimization_speed
     )
 
     # Base customer query
@@ -103,13 +124,11 @@ async def optimize_routes(
             )
 
         # Filter techs by selection
-        driver_query = driver_query.where(Tech.id.in_([UUID(tid) for tid in request.selected_tech_ids]))
+        driver_query = driver_query.where(Tech.id.in_(request.selected_tech_ids))
 
         # Filter customers by day
         day_lower = request.service_day.lower()
-        day_abbrev_map = {'monday': 'Mo', 'tuesday': 'Tu', 'wednesday': 'We',
-                          'thursday': 'Th', 'friday': 'Fr', 'saturday': 'Sa', 'sunday': 'Su'}
-        day_abbrev = day_abbrev_map.get(day_lower)
+        day_abbrev = DAY_ABBREV_MAP.get(day_lower)
 
         if day_abbrev:
             customer_query = customer_query.where(
@@ -117,10 +136,10 @@ async def optimize_routes(
             )
 
         customer_result = await db.execute(customer_query)
-        customers = list(customer_result.scalars().all())
+        customers = customer_result.scalars().all()
 
         driver_result = await db.execute(driver_query)
-        drivers = list(driver_result.scalars().all())
+        drivers = driver_result.scalars().all()
 
         if not customers or not drivers:
             return {"routes": [], "message": "No customers or techs found for optimization"}
@@ -145,16 +164,16 @@ async def optimize_routes(
             )
 
         # Filter techs by selection
-        driver_query = driver_query.where(Tech.id.in_([UUID(tid) for tid in request.selected_tech_ids]))
+        driver_query = driver_query.where(Tech.id.in_(request.selected_tech_ids))
         driver_result = await db.execute(driver_query)
-        drivers = list(driver_result.scalars().all())
+        drivers = driver_result.scalars().all()
 
         if not drivers:
             return {"routes": [], "message": "No techs found for optimization"}
 
         # Get all customers (no day filter yet)
         customer_result = await db.execute(customer_query)
-        all_customers = list(customer_result.scalars().all())
+        all_customers = customer_result.scalars().all()
 
         if not all_customers:
             return {"routes": [], "message": "No customers found for optimization"}
@@ -162,13 +181,11 @@ async def optimize_routes(
         # Optimize each day separately
         all_routes = []
         days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday']
-        day_abbrev_map = {'monday': 'Mo', 'tuesday': 'Tu', 'wednesday': 'We',
-                          'thursday': 'Th', 'friday': 'Fr', 'saturday': 'Sa'}
 
         for day in days:
             day_customers = [
                 c for c in all_customers
-                if c.service_day == day or (c.service_schedule and day_abbrev_map[day] in c.service_schedule)
+                if c.service_day == day or (c.service_schedule and DAY_ABBREV_MAP[day] in c.service_schedule)
             ]
 
             if not day_customers:
@@ -198,8 +215,16 @@ async def optimize_routes(
         if request.include_sunday:
             days.append('sunday')
 
+        # Techs are the same for every day, so load them once
+        driver_result = await db.execute(driver_query)
+        day_techs = driver_result.scalars().all()
+
+        if not day_techs:
+            return {"routes": [], "message": "No techs found for optimization"}
+
         for day in days:
-            # Get customers for this day
+            # Get customers for this day. The day and pattern are bound
+            # parameters, so every iteration reuses the same compiled statement.
             day_customer_query = customer_query.where(
                 or_(
                     Customer.service_day == day,
@@ -207,18 +232,11 @@ async def optimize_routes(
                 )
             )
             customer_result = await db.execute(day_customer_query)
-            day_customers = list(customer_result.scalars().all())
+            day_customers = customer_result.scalars().all()
 
             if not day_customers:
                 continue
 
-            # Get all techs
-            driver_result = await db.execute(driver_query)
-            day_techs = list(driver_result.scalars().all())
-
-            if not day_techs:
-                continue
-
             try:
                 day_result = await optimization_service.optimize_routes(
                     customers=day_customers,
@@ -232,9 +250,8 @@ async def optimize_routes(
 
                 if day_result and "routes" in day_result:
                     all_routes.extend(day_result["routes"])
-            except Exception as e:
-                logger.error(f"Optimization failed for {day}: {str(e)}")
-                logger.error(traceback.format_exc())
+            except Exception:
+                logger.error("Optimization failed for %s", day, exc_info=True)
                 # Continue with other days
 
         return {"routes": all_routes, "summary": {"total_routes": len(all_routes)}}
@@ -267,15 +284,6 @@ async def create_temp_assignment(
     service_day = request.get("service_day")
     today = date.today()
 
-    # Clean up old temp assignments (older than 6 days)
-    cutoff_date = today - timedelta(days=6)
-    await db.execute(
-        delete(TempTechAssignment).where(
-            TempTechAssignment.organization_id == auth.organization_id,
-            TempTechAssignment.assignment_date < cutoff_date
-        )
-    )
-
     # Get old tech ID if there was a previous temp assignment
     old_temp_result = await db.execute(
         select(TempTechAssignment).where(
@@ -318,7 +326,9 @@ async def create_temp_assignment(
         )
         db.add(temp_assignment)
 
-    await db.commit()
+    # Flush so the temp assignment is visible to the route queries below;
+    # everything is committed together at the end of the request
+    await db.flush()
 
     # Collect affected tech IDs (both old and new, excluding None)
     affected_tech_ids = set()
@@ -336,7 +346,6 @@ async def create_temp_assignment(
             TechRoute.route_date == today
         )
     )
-    await db.commit()
 
     # Generate new routes for affected techs
     updated_routes = []
@@ -352,11 +361,7 @@ async def create_temp_assignment(
 
         # Get customers for this tech on this day (with temp assignments applied)
         # Start with customers that have this day in their schedule
-        day_abbrev_map = {
-            'monday': 'Mo', 'tuesday': 'Tu', 'wednesday': 'We',
-            'thursday': 'Th', 'friday': 'Fr', 'saturday': 'Sa', 'sunday': 'Su'
-        }
-        day_abbrev = day_abbrev_map.get(service_day.lower())
+        day_abbrev = DAY_ABBREV_MAP.get(service_day.lower())
 
         customers_query = select(Customer).where(
             Customer.organization_id == auth.organization_id,
@@ -367,7 +372,7 @@ async def create_temp_assignment(
             )
         )
         customers_result = await db.execute(customers_query)
-        all_customers = list(customers_result.scalars().all())
+        all_customers = customers_result.scalars().all()
 
         # Get temp assignments for today/this day
         temp_assignments_query = select(TempTechAssignment).where(
@@ -388,20 +393,24 @@ async def create_temp_assignment(
             elif c.assigned_tech_id == tech_id:
                 tech_customers.append(c)
 
-        # Generate route (with auto-created visits)
+        # Generate route
         tech_route = await tech_routing_service.generate_route_for_tech(
             tech=tech,
             customers=tech_customers,
             service_day=service_day,
             route_date=today,
-            organization_id=auth.organization_id,
-            db_session=db
+            organization_id=auth.organization_id
         )
 
-        # Save route
+        # Save route, then its visits
         db.add(tech_route)
-        await db.commit()
-        await db.refresh(tech_route)
+        await db.flush()
+        await tech_routing_service.create_visits_for_route(
+            tech_route=tech_route,
+            tech=tech,
+            customers=tech_customers,
+            db_session=db
+        )
 
         # Convert to response format
         updated_routes.append({
@@ -413,6 +422,9 @@ async def create_temp_assignment(
             "total_duration": tech_route.total_duration
         })
 
+    await db.commit()
+    tech_routes_cache.invalidate_organization(auth.organization_id)
+
     return {
         "message": "Temporary assignment created and routes updated",
         "id": str(temp_assignment.id),
@@ -441,11 +453,11 @@ async def save_routes(
     tech_ids = [UUID(route["tech_id"]) for route in request.routes]
     if tech_ids:
         driver_check = await db.execute(
-            select(Tech)
+            select(Tech.id)
             .where(Tech.id.in_(tech_ids))
             .where(Tech.organization_id == auth.organization_id)
         )
-        valid_drivers = {str(d.id) for d in driver_check.scalars().all()}
+        valid_drivers = {str(tech_id) for tech_id in driver_check.scalars()}
 
         for route in request.routes:
             if route["tech_id"] not in valid_drivers:
@@ -454,43 +466,48 @@ async def save_routes(
                     detail=f"Tech {route['tech_id']} not found or does not belong to your organization"
                 )
 
-    # Delete existing routes for this service day and organization
-    # Must filter through driver's organization
-    existing_routes = await db.execute(
-        select(Route)
-        .join(Tech)
+    # Delete existing routes for this service day and organization; their
+    # stops go with them through the route_stops foreign key cascade
+    await db.execute(
+        delete(Route)
+        .where(Route.organization_id == auth.organization_id)
         .where(Route.service_day == request.service_day.lower())
-        .where(Tech.organization_id == auth.organization_id)
     )
-    for route in existing_routes.scalars().all():
-        await db.delete(route)
-
-    saved_routes = []
 
+    # Build every route and stop row up front. Route ids are generated here,
+    # so both tables go in as one multi-row INSERT each instead of a flush
+    # per route and an INSERT per stop.
+    routes_payload = []
+    stops_payload = []
     for route_data in request.routes:
-        # Create route
-        route = Route(
-            tech_id=UUID(route_data["tech_id"]),
-            service_day=request.service_day.lower(),
-            total_duration_minutes=route_data.get("total_duration_minutes"),
-            total_distance_miles=route_data.get("total_distance_miles"),
-            total_customers=len(route_data.get("stops", [])),
-            optimization_algorithm="google-or-tools"
+        route_id = uuid7()
+        stops = route_data.get("stops", [])
+        routes_payload.append({
+            "id": route_id,
+            "organization_id": auth.organization_id,
+            "tech_id": UUID(route_data["tech_id"]),
+            "service_day": request.service_day.lower(),
+            "total_duration_minutes": route_data.get("total_duration_minutes"),
+            "total_distance_miles": route_data.get("total_distance_miles"),
+            "total_customers": len(stops),
+            "optimization_algorithm": "google-or-tools"
+        })
+        stops_payload.extend(
+            {
+                "route_id": route_id,
+                "customer_id": UUID(stop_data["customer_id"]),
+                "sequence": stop_data["sequence"],
+                "estimated_service_duration": stop_data.get("service_duration")
+            }
+            for stop_data in stops
         )
-        db.add(route)
-        await db.flush()  # Get route ID
-
-        # Create route stops
-        for stop_data in route_data.get("stops", []):
-            stop = RouteStop(
-                route_id=route.id,
-                customer_id=UUID(stop_data["customer_id"]),
-                sequence=stop_data["sequence"],
-                estimated_service_duration=stop_data.get("service_duration")
-            )
-            db.add(stop)
 
-        saved_routes.append(str(route.id))
+    if routes_payload:
+        await db.execute(insert(Route), routes_payload)
+    if stops_payload:
+        await db.execute(insert(RouteStop), stops_payload)
+
+    saved_routes = [str(route["id"]) for route in routes_payload]
 
     await db.commit()
 
@@ -514,11 +531,12 @@ async def get_routes_by_day(
     """
     Retrieve all saved routes for a specific service day.
     """
+    # The response only reads route columns; fail loudly on any lazy load
     result = await db.execute(
         select(Route)
-        .join(Tech)
+        .options(raiseload("*"))
+        .where(Route.organization_id == auth.organization_id)
         .where(Route.service_day == service_day.lower())
-        .where(Tech.organization_id == auth.organization_id)
         .order_by(Route.created_at.desc())
     )
     routes = result.scalars().all()
@@ -539,18 +557,14 @@ async def delete_routes_by_day(
     """
     Delete all routes for a specific service day.
     """
-    # Get routes for this day that belong to this organization's drivers
-    routes_to_delete = await db.execute(
-        select(Route)
-        .join(Tech)
+    # Delete this organization's routes for the day in one statement; their
+    # stops go with them through the route_stops foreign key cascade
+    await db.execute(
+        delete(Route)
+        .where(Route.organization_id == auth.organization_id)
         .where(Route.service_day == service_day.lower())
-        .where(Tech.organization_id == auth.organization_id)
     )
 
-    # Delete each route
-    for route in routes_to_delete.scalars().all():
-        await db.delete(route)
-
     await db.commit()
 
 
@@ -566,9 +580,11 @@ async def get_route_details(
     """
     Get detailed information about a route including all stops.
     """
-    # Get route and verify organization ownership through driver
+    # Get route and verify organization ownership through driver.
+    # Stops are fetched by the explicit join below, never via Route.stops.
     route_result = await db.execute(
         select(Route)
+        .options(raiseload("*"))
         .join(Tech)
         .where(Route.id == route_id)
         .where(Tech.organization_id == auth.organization_id)
@@ -583,22 +599,22 @@ async def get_route_details(
 
     # Get stops with customer info
     stops_result = await db.execute(
-        select(RouteStop, Customer)
-        .join(Customer)
+        select(*STOP_DETAIL_COLUMNS)
+        .join(Customer, RouteStop.customer_id == Customer.id)
         .where(RouteStop.route_id == route_id)
         .order_by(RouteStop.sequence)
     )
 
     stops = []
-    for stop, customer in stops_result:
+    for row in stops_result:
         stops.append({
-            "sequence": stop.sequence,
-            "customer_id": str(customer.id),
-            "customer_name": customer.name,
-            "address": customer.address,
-            "service_duration": stop.estimated_service_duration,
-            "latitude": customer.latitude,
-            "longitude": customer.longitude
+            "sequence": row.sequence,
+            "customer_id": str(row.customer_id),
+            "customer_name": row.customer_name,
+            "address": row.address,
+            "service_duration": row.estimated_service_duration,
+            "latitude": row.latitude,
+            "longitude": row.longitude
         })
 
     return {
@@ -659,23 +675,23 @@ async def download_route_pdf(
 
     # Get stops with customer info
     stops_result = await db.execute(
-        select(RouteStop, Customer)
-        .join(Customer)
+        select(*STOP_DETAIL_COLUMNS)
+        .join(Customer, RouteStop.customer_id == Customer.id)
         .where(RouteStop.route_id == route_id)
         .order_by(RouteStop.sequence)
     )
 
     stops = []
-    for stop, customer in stops_result:
+    for row in stops_result:
         stops.append({
-            "sequence": stop.sequence,
-            "customer_id": str(customer.id),
-            "customer_name": customer.name,
-            "address": customer.address,
-            "service_type": customer.service_type,
-            "service_duration": stop.estimated_service_duration,
-            "latitude": customer.latitude,
-            "longitude": customer.longitude
+            "sequence": row.sequence,
+            "customer_id": str(row.customer_id),
+            "customer_name": row.customer_name,
+            "address": row.address,
+            "service_type": row.service_type,
+            "service_duration": row.estimated_service_duration,
+            "latitude": row.latitude,
+            "longitude": row.longitude
         })
 
     # Prepare data for PDF
@@ -720,15 +736,14 @@ async def download_day_routes_pdf(
 
     Each route gets its own page with complete route information.
     """
-    # Get all routes for this day that belong to this organization's drivers
+    # Get all routes for this day that belong to this organization
     routes_result = await db.execute(
         select(Route)
-        .join(Tech)
+        .where(Route.organization_id == auth.organization_id)
         .where(Route.service_day == service_day.lower())
-        .where(Tech.organization_id == auth.organization_id)
         .order_by(Route.created_at.desc())
     )
-    routes = list(routes_result.scalars().all())
+    routes = routes_result.scalars().all()
 
     if not routes:
         raise HTTPException(
@@ -749,23 +764,23 @@ async def download_day_routes_pdf(
     for route in routes:
         # Get stops with customer info
         stops_result = await db.execute(
-            select(RouteStop, Customer)
-            .join(Customer)
+            select(*STOP_DETAIL_COLUMNS)
+            .join(Customer, RouteStop.customer_id == Customer.id)
             .where(RouteStop.route_id == route.id)
             .order_by(RouteStop.sequence)
         )
 
         stops = []
-        for stop, customer in stops_result:
+        for row in stops_result:
             stops.append({
-                "sequence": stop.sequence,
-                "customer_id": str(customer.id),
-                "customer_name": customer.name,
-                "address": customer.address,
-                "service_type": customer.service_type,
-                "service_duration": stop.estimated_service_duration,
-                "latitude": customer.latitude,
-                "longitude": customer.longitude
+                "sequence": row.sequence,
+                "customer_id": str(row.customer_id),
+                "customer_name": row.customer_name,
+                "address": row.address,
+                "service_type": row.service_type,
+                "service_duration": row.estimated_service_duration,
+                "latitude": row.latitude,
+                "longitude": row.longitude
             })
 
         routes_data.append({
@@ -777,14 +792,11 @@ async def download_day_routes_pdf(
             "stops": stops
         })
 
-    # Generate multi-route PDF
-    pdf_buffer = pdf_export_service.generate_multi_route_pdf(routes_data, drivers_dict)
-
-    # Return as downloadable file
+    # Return as downloadable file, streamed in chunks as the PDF is read back
     filename = f"routes_{service_day}_{len(routes)}_drivers.pdf"
 
     return StreamingResponse(
-        pdf_buffer,
+        pdf_export_service.stream_multi_route_pdf(routes_data, drivers_dict),
         media_type="application/pdf",
         headers={
             "Content-Disposition": f"attachment; filename={filename}"
@@ -846,10 +858,9 @@ async def update_route_stops(
             stop.sequence = new_sequence
 
     # Update route customer count
-    stops_count_result = await db.execute(
-        select(RouteStop).where(RouteStop.route_id == route_id)
+    route.total_customers = await db.scalar(
+        select(func.count()).select_from(RouteStop).where(RouteStop.route_id == route_id)
     )
-    route.total_customers = len(list(stops_count_result.scalars().all()))
 
     await db.commit()
 
@@ -895,14 +906,16 @@ async def move_stop_to_route(
             detail=f"Stop with ID {stop_id} not found"
         )
 
-    # Get target route and verify organization ownership
-    target_route_result = await db.execute(
+    # Get target and source routes in one query, verifying organization ownership
+    routes_result = await db.execute(
         select(Route)
         .join(Tech)
-        .where(Route.id == target_route_id)
+        .where(Route.id.in_([target_route_id, stop.route_id]))
         .where(Tech.organization_id == auth.organization_id)
     )
-    target_route = target_route_result.scalar_one_or_none()
+    routes_by_id = {route.id: route for route in routes_result.scalars()}
+    target_route = routes_by_id.get(target_route_id)
+    source_route = routes_by_id.get(stop.route_id)
 
     if not target_route:
         raise HTTPException(
@@ -910,15 +923,6 @@ async def move_stop_to_route(
             detail=f"Target route with ID {target_route_id} not found"
         )
 
-    # Get source route and verify organization ownership
-    source_route_result = await db.execute(
-        select(Route)
-        .join(Tech)
-        .where(Route.id == stop.route_id)
-        .where(Tech.organization_id == auth.organization_id)
-    )
-    source_route = source_route_result.scalar_one_or_none()
-
     if not source_route:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -930,24 +934,32 @@ async def move_stop_to_route(
     stop.route_id = target_route_id
     stop.sequence = new_sequence
 
-    # Resequence remaining stops in source route
-    source_stops_result = await db.execute(
-        select(RouteStop)
+    # Flush the move so the queries below see the stop on its new route
+    await db.flush()
+
+    # Resequence remaining stops in source route with a single UPDATE;
+    # every remaining stop is updated, so rowcount is the new stop count
+    ranked_stops = (
+        select(
+            RouteStop.id,
+            func.row_number().over(order_by=RouteStop.sequence).label("position")
+        )
         .where(RouteStop.route_id == old_route_id)
-        .order_by(RouteStop.sequence)
+        .subquery()
+    )
+    resequence_result = await db.execute(
+        update(RouteStop)
+        .where(RouteStop.id == ranked_stops.c.id)
+        .values(sequence=ranked_stops.c.position)
+        .execution_options(synchronize_session=False)
     )
-    source_stops = list(source_stops_result.scalars().all())
-    for idx, source_stop in enumerate(source_stops, start=1):
-        source_stop.sequence = idx
 
     # Update customer counts
-    if source_route:
-        source_route.total_customers = len(source_stops)
+    source_route.total_customers = resequence_result.rowcount
 
-    target_stops_result = await db.execute(
-        select(RouteStop).where(RouteStop.route_id == target_route_id)
+    target_route.total_customers = await db.scalar(
+        select(func.count()).select_from(RouteStop).where(RouteStop.route_id == target_route_id)
     )
-    target_route.total_customers = len(list(target_stops_result.scalars().all()))
 
     await db.commit()
 
@@ -962,7 +974,9 @@ async def move_stop_to_route(
 
 @router.get(
     "/tech-routes/{service_day}",
-    summary="Get tech routes for a specific day"
+    summary="Get tech routes for a specific day",
+    # Generates and stores missing routes and their visits in one transaction
+    dependencies=[Depends(require_transaction)]
 )
 async def get_tech_routes_for_day(
     service_day: str,
@@ -976,15 +990,23 @@ async def get_tech_routes_for_day(
     """
     today = date.today()
 
-    # Get all tech routes for this day and organization
-    result = await db.execute(
+    # Reuse a recently built response; mutations invalidate the organization
+    cache_key = ("tech_routes", service_day, today)
+    cached_routes = tech_routes_cache.get(auth.organization_id, cache_key)
+    if cached_routes is not None:
+        return cached_routes
+
+    # Get all tech routes for this day and organization, with their techs
+    # joined into the same query (tech_id is non-nullable, so inner join)
+    tech_routes_query = (
         select(TechRoute)
-        .options(selectinload(TechRoute.tech))
+        .options(joinedload(TechRoute.tech, innerjoin=True))
         .where(TechRoute.organization_id == auth.organization_id)
         .where(TechRoute.service_day == service_day)
         .where(TechRoute.route_date == today)
     )
-    tech_routes = list(result.scalars().all())
+    result = await db.execute(tech_routes_query)
+    tech_routes = result.scalars().all()
 
     # If no routes exist, auto-generate them
     if not tech_routes:
@@ -998,6 +1020,11 @@ async def get_tech_routes_for_day(
         )
         techs = techs_result.scalars().all()
 
+        # Nothing can be routed without active techs
+        if not techs:
+            tech_routes_cache.set(auth.organization_id, cache_key, [])
+            return []
+
         # Get all customers with temp assignments applied
         temp_assignments_result = await db.execute(
             select(TempTechAssignment)
@@ -1006,89 +1033,132 @@ async def get_tech_routes_for_day(
             .where(TempTechAssignment.assignment_date == today)
         )
         temp_assignments_by_customer = {
-            str(ta.customer_id): ta for ta in temp_assignments_result.scalars().all()
+            ta.customer_id: ta for ta in temp_assignments_result.scalars().all()
         }
 
-        # Generate route for each tech
-        for tech in techs:
-            # Get customers for this tech and day (with temp assignments applied)
-            customers_query = (
-                select(Customer)
-                .where(Customer.organization_id == auth.organization_id)
-                .where(Customer.is_active == True)
-            )
-
-            customers_result = await db.execute(customers_query)
-            all_customers = customers_result.scalars().all()
-
-            # Day abbreviation mapping for service_schedule check
-            day_abbrev_map = {
-                'monday': 'Mo', 'tuesday': 'Tu', 'wednesday': 'We',
-                'thursday': 'Th', 'friday': 'Fr', 'saturday': 'Sa', 'sunday': 'Su'
-            }
-            day_abbrev = day_abbrev_map.get(service_day.lower())
-
-            # Filter customers for this tech and day
-            tech_customers = []
-            for customer in all_customers:
-                # Check if customer is scheduled for this day
-                is_scheduled_today = (
-                    customer.service_day == service_day or
-                    (day_abbrev and customer.service_schedule and day_abbrev in customer.service_schedule)
-                )
-
-                if not is_scheduled_today:
-                    continue
-
-                # Check if there's a temp assignment for this customer
-                temp_assignment = temp_assignments_by_customer.get(str(customer.id))
+        # Day abbreviation for the service_schedule check
+        day_abbrev = DAY_ABBREV_MAP.get(service_day.lower())
+
+        # Get active customers scheduled for this day that belong to one of
+        # these techs, either permanently or through a temp assignment
+        customers_result = await db.execute(
+            select(Customer)
+            .where(Customer.organization_id == auth.organization_id)
+            .where(Customer.is_active == True)
+            .where(or_(
+                Customer.service_day == service_day,
+                Customer.service_schedule.like(f'%{day_abbrev}%') if day_abbrev else False
+            ))
+            .where(or_(
+                Customer.assigned_tech_id.in_([tech.id for tech in techs]),
+                Customer.id.in_(list(temp_assignments_by_customer))
+            ))
+        )
 
-                if temp_assignment:
-                    # Use temp assignment
-                    if temp_assignment.tech_id == tech.id:
-                        tech_customers.append(customer)
-                else:
-                    # Use permanent assignment
-                    if customer.assigned_tech_id == tech.id:
-                        tech_customers.append(customer)
+        # Bucket customers by their effective tech
+        # (temp assignment if one exists, otherwise permanent assignment)
+        customers_by_tech = defaultdict(list)
+        for customer in customers_result.scalars():
+            temp_assignment = temp_assignments_by_customer.get(customer.id)
+            effective_tech_id = temp_assignment.tech_id if temp_assignment else customer.assigned_tech_id
+            customers_by_tech[effective_tech_id].append(customer)
+
+        # Generate route for each tech; collect them so they are written
+        # with a single INSERT
+        new_tech_routes = []
+        for tech in techs:
+            tech_customers = customers_by_tech.get(tech.id, [])
 
-            # Generate route if tech has customers (with auto-created visits)
+            # Generate route if tech has customers; visits are created once
+            # the route is known to be stored
             if tech_customers:
                 tech_route = await tech_routing_service.generate_route_for_tech(
                     tech=tech,
                     customers=tech_customers,
                     service_day=service_day,
                     route_date=today,
-                    organization_id=auth.organization_id,
-                    db_session=db
+                    organization_id=auth.organization_id
                 )
 
-                db.add(tech_route)
-                tech_routes.append(tech_route)
-
+                # The tech is already loaded; attach it so building the
+                # response needs no reload
+                tech_route.tech = tech
+                new_tech_routes.append(tech_route)
+
+        # A concurrent request may generate the same routes; the unique
+        # (tech_id, service_day, route_date) index lets only one insert win
+        inserted_tech_ids = set()
+        if new_tech_routes:
+            insert_result = await db.execute(
+                pg_insert(TechRoute)
+                .values([
+                    {
+                        "organization_id": tech_route.organization_id,
+                        "tech_id": tech_route.tech_id,
+                        "service_day": tech_route.service_day,
+                        "route_date": tech_route.route_date,
+                        "stop_sequence": tech_route.stop_sequence,
+                        "total_distance": tech_route.total_distance,
+                        "total_duration": tech_route.total_duration
+                    }
+                    for tech_route in new_tech_routes
+                ])
+                .on_conflict_do_nothing(index_elements=["tech_id", "service_day", "route_date"])
+                .returning(TechRoute.tech_id)
+            )
+            inserted_tech_ids = set(insert_result.scalars())
+
+        # Only the request that stored a route writes its visits, so racing
+        # requests cannot delete and re-insert each other's visits
+        for tech_route in new_tech_routes:
+            if tech_route.tech_id in inserted_tech_ids:
+                await tech_routing_service.create_visits_for_route(
+                    tech_route=tech_route,
+                    tech=tech_route.tech,
+                    customers=customers_by_tech[tech_route.tech_id],
+                    db_session=db
+                )
         await db.commit()
 
-        # Reload with relationships
-        if tech_routes:
-            result = await db.execute(
-                select(TechRoute)
-                .options(selectinload(TechRoute.tech))
-                .where(TechRoute.organization_id == auth.organization_id)
-                .where(TechRoute.service_day == service_day)
-                .where(TechRoute.route_date == today)
-            )
-            tech_routes = list(result.scalars().all())
+        if len(inserted_tech_ids) == len(new_tech_routes):
+            tech_routes.extend(new_tech_routes)
+        else:
+            # Lost the race for some techs; use the routes that were stored
+            result = await db.execute(tech_routes_query)
+            tech_routes = result.scalars().all()
 
     if not tech_routes:
+        tech_routes_cache.set(auth.organization_id, cache_key, [])
         return []
 
-    # Get all active customers for this organization to look up details
+    # Look up details only for the active customers that appear on these routes
+    needed_customer_ids = {
+        UUID(customer_id)
+        for tech_route in tech_routes
+        for customer_id in tech_route.stop_sequence
+    }
     customer_result = await db.execute(
-        select(Customer)
+        select(
+            Customer.id,
+            Customer.name,
+            Customer.display_name,
+            Customer.address,
+            Customer.latitude,
+            Customer.longitude
+        )
+        .where(Customer.id.in_(needed_customer_ids))
         .where(Customer.organization_id == auth.organization_id)
         .where(Customer.is_active == True)
     )
-    customers_by_id = {str(c.id): c for c in customer_result.scalars().all()}
+    customers_by_id = {str(c.id): c for c in customer_result}
+
+    # Format each address as "street, city" once per customer, not per stop
+    short_address_by_id = {}
+    for customer_id, customer in customers_by_id.items():
+        address_parts = customer.address.split(',')
+        short_address_by_id[customer_id] = (
+            ', '.join(address_parts[:2]).strip() if len(address_parts) >= 2 else customer.address
+        )
 
     # Build response
     routes = []
@@ -1098,14 +1168,10 @@ async def get_tech_routes_for_day(
         for customer_id in tech_route.stop_sequence:
             customer = customers_by_id.get(customer_id)
             if customer:
-                # Format address as "street, city"
-                address_parts = customer.address.split(',')
-                short_address = ', '.join(address_parts[:2]).strip() if len(address_parts) >= 2 else customer.address
-
                 stops.append({
                     "customer_id": customer_id,
                     "customer_name": customer.display_name or customer.name,
-                    "address": short_address,
+                    "address": short_address_by_id[customer_id],
                     "latitude": customer.latitude,
                     "longitude": customer.longitude
                 })
@@ -1132,4 +1198,5 @@ async def get_tech_routes_for_day(
             "total_duration": tech_route.total_duration
         })
 
+    tech_routes_cache.set(auth.organization_id, cache_key, routes)
     return routes
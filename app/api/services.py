@@ -5,13 +5,14 @@ API endpoints for service catalog management.
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, update, delete
 from typing import Optional
 from uuid import UUID
 
 from app.database import get_db
 from app.dependencies.auth import get_current_user, AuthContext
 from app.models.service_catalog import ServiceCatalog
+from app.models.visit_service import VisitService
 from app.schemas.service_catalog import (
     ServiceCatalogCreate,
     ServiceCatalogUpdate,
@@ -47,10 +48,8 @@ async def list_services(
         result = await db.execute(query)
         services = result.scalars().all()
 
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await db.scalar(count_query)
-
-        return ServiceCatalogListResponse(services=services, total=total or 0)
+        # Not paginated, so the total is simply the number of rows returned
+        return ServiceCatalogListResponse(services=services, total=len(services))
 
     except Exception as e:
         logger.error(f"Error listing services: {e}")
@@ -162,24 +161,29 @@ async def delete_service(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a service from the catalog."""
-    result = await db.execute(
-        select(ServiceCatalog).where(
-            ServiceCatalog.id == service_id,
-            ServiceCatalog.organization_id == auth.organization_id
-        )
+    owned_service = select(ServiceCatalog.id).where(
+        ServiceCatalog.id == service_id,
+        ServiceCatalog.organization_id == auth.organization_id
     )
-    service = result.scalar_one_or_none()
-
-    if not service:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Service not found"
-        )
 
     try:
-        await db.delete(service)
+        # Keep visit history: detach visit services from the catalog entry
+        # (what the ORM did on delete) before removing it
+        await db.execute(
+            update(VisitService)
+            .where(VisitService.service_catalog_id.in_(owned_service))
+            .values(service_catalog_id=None)
+        )
+        result = await db.execute(
+            delete(ServiceCatalog)
+            .where(
+                ServiceCatalog.id == service_id,
+                ServiceCatalog.organization_id == auth.organization_id
+            )
+            .returning(ServiceCatalog.id)
+        )
+        deleted_id = result.scalar_one_or_none()
         await db.commit()
-        logger.info(f"Deleted service {service_id}")
 
     except Exception as e:
         await db.rollback()
@@ -188,3 +192,11 @@ async def delete_service(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error deleting service"
         )
+
+    if deleted_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Service not found"
+        )
+
+    logger.info(f"Deleted service {service_id}")
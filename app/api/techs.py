@@ -6,6 +6,7 @@ Provides CRUD operations for techs/technicians.
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from sqlalchemy.orm import load_only, raiseload
 from typing import Optional
 from uuid import UUID
 
@@ -19,10 +20,34 @@ from app.schemas.tech import (
     TechResponse,
     TechListResponse
 )
+from app.services.cache import tech_routes_cache
 from app.services.geocoding import geocoding_service
 
 router = APIRouter(prefix="/api/techs", tags=["techs"])
 
+# Columns serialized by TechResponse; list endpoints load only these
+TECH_RESPONSE_COLUMNS = (
+    Tech.id,
+    Tech.name,
+    Tech.email,
+    Tech.phone,
+    Tech.color,
+    Tech.start_location_address,
+    Tech.start_latitude,
+    Tech.start_longitude,
+    Tech.end_location_address,
+    Tech.end_latitude,
+    Tech.end_longitude,
+    Tech.working_hours_start,
+    Tech.working_hours_end,
+    Tech.max_customers_per_day,
+    Tech.efficiency_multiplier,
+    Tech.notes,
+    Tech.is_active,
+    Tech.created_at,
+    Tech.updated_at,
+)
+
 
 @router.post(
     "/",
@@ -51,18 +76,19 @@ async def create_tech(
     tech_data['organization_id'] = auth.organization_id
     db_tech = Tech(**tech_data)
 
-    # Geocode start location
-    start_coords = await geocoding_service.geocode_address(db_tech.start_location_address)
+    # Geocode start and end locations concurrently
+    start_coords, end_coords = await geocoding_service.geocode_addresses(
+        db_tech.start_location_address,
+        db_tech.end_location_address
+    )
     if start_coords:
         db_tech.start_latitude, db_tech.start_longitude = start_coords
-
-    # Geocode end location
-    end_coords = await geocoding_service.geocode_address(db_tech.end_location_address)
     if end_coords:
         db_tech.end_latitude, db_tech.end_longitude = end_coords
 
     db.add(db_tech)
     await db.commit()
+    tech_routes_cache.invalidate_organization(auth.organization_id)
     await db.refresh(db_tech)
     return db_tech
 
@@ -87,25 +113,34 @@ async def list_techs(
     - **is_active**: Filter by active/inactive status
     - **service_day**: If provided, includes customer_count for that day
     """
-    # Build base query
-    query = select(Tech).where(Tech.organization_id == auth.organization_id)
-
-    # Apply filters
+    # Build filters
+    filters = [Tech.organization_id == auth.organization_id]
     if is_active is not None:
-        query = query.where(Tech.is_active == is_active)
-
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
+        filters.append(Tech.is_active == is_active)
 
-    # Apply pagination
+    # Fetch the page with the unpaginated total on every row (count(*) OVER ())
     offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Tech.name)
+    query = (
+        select(Tech, func.count().over().label("total"))
+        .options(load_only(*TECH_RESPONSE_COLUMNS), raiseload("*"))
+        .where(*filters)
+        .offset(offset)
+        .limit(page_size)
+        .order_by(Tech.name)
+    )
 
     # Execute query
     result = await db.execute(query)
-    techs = result.scalars().all()
+    rows = result.all()
+    techs = [row.Tech for row in rows]
+
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Page is past the end, so no row carries the total
+        total = await db.scalar(select(func.count()).select_from(Tech).where(*filters))
+    else:
+        total = 0
 
     # If no service_day, return techs as-is
     if not service_day:
@@ -163,6 +198,7 @@ async def get_active_techs(
     """
     result = await db.execute(
         select(Tech)
+        .options(load_only(*TECH_RESPONSE_COLUMNS), raiseload("*"))
         .where(Tech.organization_id == auth.organization_id)
         .where(Tech.is_active == True)
         .order_by(Tech.name)
@@ -294,18 +330,18 @@ async def update_tech(
     for field, value in update_data.items():
         setattr(tech, field, value)
 
-    # Re-geocode if locations changed
-    if "start_location_address" in update_data:
-        start_coords = await geocoding_service.geocode_address(tech.start_location_address)
-        if start_coords:
-            tech.start_latitude, tech.start_longitude = start_coords
-
-    if "end_location_address" in update_data:
-        end_coords = await geocoding_service.geocode_address(tech.end_location_address)
-        if end_coords:
-            tech.end_latitude, tech.end_longitude = end_coords
+    # Re-geocode changed locations concurrently
+    start_coords, end_coords = await geocoding_service.geocode_addresses(
+        tech.start_location_address if "start_location_address" in update_data else None,
+        tech.end_location_address if "end_location_address" in update_data else None
+    )
+    if start_coords:
+        tech.start_latitude, tech.start_longitude = start_coords
+    if end_coords:
+        tech.end_latitude, tech.end_longitude = end_coords
 
     await db.commit()
+    tech_routes_cache.invalidate_organization(auth.organization_id)
     await db.refresh(tech)
     return tech
 
@@ -340,3 +376,4 @@ async def delete_tech(
 
     await db.delete(tech)
     await db.commit()
+    tech_routes_cache.invalidate_organization(auth.organization_id)
@@ -2,15 +2,17 @@
 API endpoints for visit management.
 """
 
+import base64
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func, literal_column, lambda_stmt, tuple_, JSON
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.orm import selectinload
-from typing import Optional
+from typing import Optional, Tuple
 from uuid import UUID
-from datetime import datetime, date
+from datetime import datetime, date, time, timedelta
 
 from app.database import get_db
 from app.dependencies.auth import get_current_user, AuthContext
@@ -30,6 +32,73 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/visits", tags=["visits"])
 
+# Relationships read by VisitResponse: selectin for the collection, joined
+# for the many-to-one catalog entry of each visit service
+VISIT_RESPONSE_LOADERS = (
+    selectinload(Visit.customer),
+    selectinload(Visit.tech),
+    selectinload(Visit.services).joinedload(VisitService.service),
+)
+
+
+def _owned_visit_stmt(visit_id: UUID, organization_id: UUID) -> StatementLambdaElement:
+    """
+    Select one visit belonging to an organization.
+
+    Built with lambda_stmt so the statement is constructed and cached once;
+    only the bound ids change between calls.
+    """
+    return lambda_stmt(
+        lambda: select(Visit).where(Visit.id == visit_id, Visit.organization_id == organization_id)
+    )
+
+
+def _visit_response_stmt(visit_id: UUID, organization_id: UUID) -> StatementLambdaElement:
+    """Like _owned_visit_stmt, with the relationships VisitResponse reads."""
+    return lambda_stmt(
+        lambda: select(Visit)
+        .options(*VISIT_RESPONSE_LOADERS)
+        .where(Visit.id == visit_id, Visit.organization_id == organization_id)
+    )
+
+
+def _visit_to_response(visit: Visit) -> VisitResponse:
+    """
+    Build a VisitResponse from a Visit loaded with VISIT_RESPONSE_LOADERS.
+
+    Trust boundary: everything here comes from typed database columns, so
+    validation is skipped with model_construct. Client input (VisitCreate,
+    VisitUpdate) is still validated on the way in.
+    """
+    data = {column.key: getattr(visit, column.key) for column in Visit.__table__.columns}
+    data["customer_name"] = visit.customer.display_name if visit.customer else None
+    data["customer_address"] = visit.customer.address if visit.customer else None
+    data["tech_name"] = visit.tech.name if visit.tech else None
+    data["services"] = VisitResponse.flatten_services(visit.services)
+    return VisitResponse.model_construct(**data)
+
+
+def _encode_visit_cursor(scheduled_date: datetime, visit_id: UUID) -> str:
+    """Encode a (scheduled_date, id) keyset position as an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{scheduled_date.isoformat()}|{visit_id}".encode()).decode()
+
+
+def _decode_visit_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by _encode_visit_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        scheduled_date, visit_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(scheduled_date), UUID(visit_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
 
 @router.get("", response_model=VisitListResponse, summary="List visits")
 async def list_visits(
@@ -39,11 +108,16 @@ async def list_visits(
     status: Optional[str] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    limit: int = Query(100, ge=1, le=500, description="Maximum visits to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     auth: AuthContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Get list of visits with optional filters.
+    Get list of visits with optional filters, newest first.
+
+    Results are paged by keyset: pass the returned next_cursor to get the
+    following page (next_cursor is null on the last page).
 
     Filters:
     - service_day: Filter by day of week (monday, tuesday, etc.)
@@ -53,14 +127,36 @@ async def list_visits(
     - start_date: Filter visits on or after this date
     - end_date: Filter visits on or before this date
     """
+    # Shape each visit in SQL: customer/tech names are joined in and the
+    # visit's services are aggregated into a JSON array (grouping by the
+    # primary keys lets Postgres return the remaining columns as-is)
+    services_json = func.coalesce(
+        func.json_agg(
+            func.json_build_object(
+                'id', VisitService.id,
+                'service_catalog_id', VisitService.service_catalog_id,
+                'custom_service_name', VisitService.custom_service_name,
+                'notes', VisitService.notes,
+                'service_name', func.coalesce(ServiceCatalog.name, VisitService.custom_service_name)
+            )
+        ).filter(VisitService.id.isnot(None)),
+        literal_column("'[]'::json"),
+        type_=JSON
+    )
     query = (
-        select(Visit)
-        .options(
-            selectinload(Visit.customer),
-            selectinload(Visit.tech),
-            selectinload(Visit.services)
+        select(
+            *Visit.__table__.columns,
+            Customer.display_name.label("customer_name"),
+            Customer.address.label("customer_address"),
+            Tech.name.label("tech_name"),
+            services_json.label("services")
         )
+        .outerjoin(Customer, Customer.id == Visit.customer_id)
+        .outerjoin(Tech, Tech.id == Visit.tech_id)
+        .outerjoin(VisitService, VisitService.visit_id == Visit.id)
+        .outerjoin(ServiceCatalog, ServiceCatalog.id == VisitService.service_catalog_id)
         .where(Visit.organization_id == auth.organization_id)
+        .group_by(Visit.id, Customer.id, Tech.id)
     )
 
     # Auto-filter by tech_id if user is a tech (unless explicitly overridden)
@@ -75,36 +171,31 @@ async def list_visits(
         query = query.where(Visit.customer_id == customer_id)
     if status:
         query = query.where(Visit.status == status)
+    # Compare the raw timestamp column against day boundaries (half-open
+    # range) so the scheduled_date indexes stay usable
     if start_date:
-        query = query.where(Visit.scheduled_date >= datetime.combine(start_date, datetime.min.time()))
+        query = query.where(Visit.scheduled_date >= datetime.combine(start_date, time.min))
     if end_date:
-        query = query.where(Visit.scheduled_date <= datetime.combine(end_date, datetime.max.time()))
+        query = query.where(Visit.scheduled_date < datetime.combine(end_date + timedelta(days=1), time.min))
+
+    if cursor:
+        cursor_date, cursor_id = _decode_visit_cursor(cursor)
+        query = query.where(tuple_(Visit.scheduled_date, Visit.id) < tuple_(cursor_date, cursor_id))
 
-    query = query.order_by(Visit.scheduled_date.desc())
+    # Fetch one extra row to know whether another page follows
+    query = query.order_by(Visit.scheduled_date.desc(), Visit.id.desc()).limit(limit + 1)
 
     result = await db.execute(query)
-    visits = result.scalars().all()
-
-    # Enrich with related data
-    visit_responses = []
-    for visit in visits:
-        visit_data = VisitResponse.model_validate(visit)
-        visit_data.customer_name = visit.customer.display_name if visit.customer else None
-        visit_data.customer_address = visit.customer.address if visit.customer else None
-        visit_data.tech_name = visit.tech.name if visit.tech else None
-        visit_data.services = [
-            {
-                "id": str(vs.id),
-                "service_catalog_id": str(vs.service_catalog_id) if vs.service_catalog_id else None,
-                "custom_service_name": vs.custom_service_name,
-                "notes": vs.notes,
-                "service_name": vs.service.name if vs.service else vs.custom_service_name
-            }
-            for vs in visit.services
-        ] if visit.services else []
-        visit_responses.append(visit_data)
-
-    return VisitListResponse(visits=visit_responses, total=len(visit_responses))
+    # Rows are already shaped by SQL and typed by the columns, so skip validation
+    visit_responses = [VisitResponse.model_construct(**row._mapping) for row in result]
+
+    next_cursor = None
+    if len(visit_responses) > limit:
+        visit_responses = visit_responses[:limit]
+        last = visit_responses[-1]
+        next_cursor = _encode_visit_cursor(last.scheduled_date, last.id)
+
+    return VisitListResponse(visits=visit_responses, total=len(visit_responses), next_cursor=next_cursor)
 
 
 @router.get("/{visit_id}", response_model=VisitResponse, summary="Get visit by ID")
@@ -114,18 +205,7 @@ async def get_visit(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific visit by ID."""
-    result = await db.execute(
-        select(Visit)
-        .options(
-            selectinload(Visit.customer),
-            selectinload(Visit.tech),
-            selectinload(Visit.services)
-        )
-        .where(
-            Visit.id == visit_id,
-            Visit.organization_id == auth.organization_id
-        )
-    )
+    result = await db.execute(_visit_response_stmt(visit_id, auth.organization_id))
     visit = result.scalar_one_or_none()
 
     if not visit:
@@ -134,22 +214,7 @@ async def get_visit(
             detail="Visit not found"
         )
 
-    visit_data = VisitResponse.model_validate(visit)
-    visit_data.customer_name = visit.customer.display_name if visit.customer else None
-    visit_data.customer_address = visit.customer.address if visit.customer else None
-    visit_data.tech_name = visit.tech.name if visit.tech else None
-    visit_data.services = [
-        {
-            "id": str(vs.id),
-            "service_catalog_id": str(vs.service_catalog_id) if vs.service_catalog_id else None,
-            "custom_service_name": vs.custom_service_name,
-            "notes": vs.notes,
-            "service_name": vs.service.name if vs.service else vs.custom_service_name
-        }
-        for vs in visit.services
-    ] if visit.services else []
-
-    return visit_data
+    return _visit_to_response(visit)
 
 
 @router.post("", response_model=VisitResponse, status_code=status.HTTP_201_CREATED, summary="Create visit")
@@ -159,29 +224,26 @@ async def create_visit(
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new visit (manual entry)."""
-    # Verify customer exists and belongs to organization
-    customer_result = await db.execute(
-        select(Customer).where(
-            Customer.id == visit_data.customer_id,
-            Customer.organization_id == auth.organization_id
+    # Verify customer and tech exist and belong to organization in one round-trip
+    owned = await db.execute(
+        select(
+            select(Customer.id).where(
+                Customer.id == visit_data.customer_id,
+                Customer.organization_id == auth.organization_id
+            ).exists().label("customer_found"),
+            select(Tech.id).where(
+                Tech.id == visit_data.tech_id,
+                Tech.organization_id == auth.organization_id
+            ).exists().label("tech_found")
         )
     )
-    customer = customer_result.scalar_one_or_none()
-    if not customer:
+    customer_found, tech_found = owned.one()
+    if not customer_found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Customer not found"
         )
-
-    # Verify tech exists and belongs to organization
-    tech_result = await db.execute(
-        select(Tech).where(
-            Tech.id == visit_data.tech_id,
-            Tech.organization_id == auth.organization_id
-        )
-    )
-    tech = tech_result.scalar_one_or_none()
-    if not tech:
+    if not tech_found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tech not found"
@@ -193,18 +255,17 @@ async def create_visit(
         **visit_data.model_dump()
     )
     db.add(visit)
-    await db.commit()
-    await db.refresh(visit)
-
-    # Load relationships
-    await db.refresh(visit, ["customer", "tech"])
+    # Flush for the id and server defaults; get_db commits once the handler
+    # returns, so the reload runs in the same transaction
+    await db.flush()
 
-    visit_response = VisitResponse.model_validate(visit)
-    visit_response.customer_name = visit.customer.display_name
-    visit_response.customer_address = visit.customer.address
-    visit_response.tech_name = visit.tech.name
+    # Reload with the relationships used by the response
+    result = await db.execute(
+        _visit_response_stmt(visit.id, auth.organization_id),
+        execution_options={"populate_existing": True}
+    )
 
-    return visit_response
+    return _visit_to_response(result.scalar_one())
 
 
 @router.put("/{visit_id}", response_model=VisitResponse, summary="Update visit")
@@ -215,12 +276,7 @@ async def update_visit(
     db: AsyncSession = Depends(get_db)
 ):
     """Update a visit (typically filled in by tech during/after service)."""
-    result = await db.execute(
-        select(Visit).where(
-            Visit.id == visit_id,
-            Visit.organization_id == auth.organization_id
-        )
-    )
+    result = await db.execute(_owned_visit_stmt(visit_id, auth.organization_id))
     visit = result.scalar_one_or_none()
 
     if not visit:
@@ -238,18 +294,15 @@ async def update_visit(
     if visit_data.status == "completed" and visit.status != "completed":
         visit.completed_at = datetime.utcnow()
 
-    await db.commit()
-    await db.refresh(visit)
-
-    # Load relationships
-    await db.refresh(visit, ["customer", "tech"])
+    await db.flush()
 
-    visit_response = VisitResponse.model_validate(visit)
-    visit_response.customer_name = visit.customer.display_name
-    visit_response.customer_address = visit.customer.address
-    visit_response.tech_name = visit.tech.name
+    # Reload with the relationships used by the response
+    result = await db.execute(
+        _visit_response_stmt(visit.id, auth.organization_id),
+        execution_options={"populate_existing": True}
+    )
 
-    return visit_response
+    return _visit_to_response(result.scalar_one())
 
 
 @router.delete("/{visit_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete visit")
@@ -259,12 +312,7 @@ async def delete_visit(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a visit."""
-    result = await db.execute(
-        select(Visit).where(
-            Visit.id == visit_id,
-            Visit.organization_id == auth.organization_id
-        )
-    )
+    result = await db.execute(_owned_visit_stmt(visit_id, auth.organization_id))
     visit = result.scalar_one_or_none()
 
     if not visit:
@@ -295,12 +343,7 @@ async def add_service_to_visit(
 ):
     """Add a service to a visit (from catalog or custom)."""
     # Verify visit exists and belongs to organization
-    result = await db.execute(
-        select(Visit).where(
-            Visit.id == visit_id,
-            Visit.organization_id == auth.organization_id
-        )
-    )
+    result = await db.execute(_owned_visit_stmt(visit_id, auth.organization_id))
     visit = result.scalar_one_or_none()
     if not visit:
         raise HTTPException(
@@ -359,12 +402,7 @@ async def remove_service_from_visit(
 ):
     """Remove a service from a visit."""
     # Verify visit exists and belongs to organization
-    result = await db.execute(
-        select(Visit).where(
-            Visit.id == visit_id,
-            Visit.organization_id == auth.organization_id
-        )
-    )
+    result = await db.execute(_owned_visit_stmt(visit_id, auth.organization_id))
     visit = result.scalar_one_or_none()
     if not visit:
         raise HTTPException(
@@ -4,6 +4,7 @@ Loads configuration from environment variables and .env file.
 """
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import cached_property
 from typing import Optional
 
 
@@ -12,6 +13,13 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    # Connection pool sizing (per process)
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_timeout_seconds: int = 30
+    db_pool_recycle_seconds: int = 1800
+    # Log every SQL statement (slow; enable only when debugging queries)
+    db_echo: bool = False
 
     # Security
     secret_key: str
@@ -24,9 +32,17 @@ class Settings(BaseSettings):
 
     # Geocoding
     google_maps_api_key: Optional[str] = None
+    # Concurrent lookups for bulk geocoding with Google Maps (Nominatim is
+    # always one at a time to respect its 1 req/sec limit)
+    geocoding_max_concurrency: int = 10
 
     # CORS
     allowed_origins: str = "http://localhost:8000"
+    # Disable when a reverse proxy handles CORS (or the frontend is same-origin)
+    enable_cors_middleware: bool = True
+
+    # Static frontend files (disable when a reverse proxy/CDN serves /static)
+    serve_static: bool = True
 
     # Logging
     log_level: str = "INFO"
@@ -34,32 +50,49 @@ class Settings(BaseSettings):
     # Optimization
     optimization_time_limit_seconds: int = 120
     max_customers_per_route: int = 50
+    # Single-tech days with at most this many customers skip OR-Tools and use
+    # a greedy nearest-neighbor route (0 disables the shortcut)
+    greedy_route_max_customers: int = 20
 
     # Routing (distance/time calculations)
     routing_provider: str = "osrm"  # Options: "osrm" (free), "google" (paid)
     osrm_server_url: str = "http://router.project-osrm.org"  # Public OSRM server
 
+    # Background maintenance
+    temp_assignment_retention_days: int = 6
+    temp_assignment_cleanup_interval_seconds: int = 6 * 60 * 60
+
+    # Caching
+    # Seconds a built tech routes response is reused (0 disables the cache)
+    tech_routes_cache_ttl_seconds: int = 300
+    # Seconds a token's active user/organization check is reused (0 disables)
+    auth_cache_ttl_seconds: int = 60
+    # Seconds a geocoded address is reused (0 disables) and max addresses held
+    geocoding_cache_ttl_seconds: int = 24 * 60 * 60
+    geocoding_cache_max_entries: int = 10000
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        frozen=True  # Settings are read-only after startup, so derived values can be cached
     )
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development mode."""
         return self.environment == "development"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production mode."""
         return self.environment == "production"
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
-        """Parse CORS origins from comma-separated string."""
-        return [origin.strip() for origin in self.allowed_origins.split(",")]
+        """Parse CORS origins from comma-separated string (once), skipping blanks."""
+        return [origin.strip() for origin in self.allowed_origins.split(",") if origin.strip()]
 
 
 # Global settings instance
@@ -3,16 +3,32 @@ Database configuration and session management.
 Uses async SQLAlchemy 2.0 with PostgreSQL.
 """
 
+from fastapi import Request
+from sqlalchemy import DDL, event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import settings
+import asyncio
+import orjson
+import os
+import time
+import uuid
 
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
-    echo=settings.is_development,  # Log SQL queries in development
+    echo=settings.db_echo,  # Log SQL queries (debugging only)
     future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout_seconds,
+    pool_recycle=settings.db_pool_recycle_seconds,  # Replace connections before server-side timeouts
     pool_pre_ping=True,  # Verify connections before using
+    # orjson for JSON/JSONB columns (e.g. visit and issue photos)
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads,
 )
 
 # Create async session factory
@@ -24,23 +40,145 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Session factory for read requests: same pool, but AUTOCOMMIT, so no
+# BEGIN/ROLLBACK round-trips wrap their queries. Each statement still sees a
+# fresh snapshot, as under the default READ COMMITTED. Server-side cursors
+# (AsyncSession.stream) need a transaction, so streaming code keeps
+# AsyncSessionLocal.
+ReadOnlySessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 # Base class for all models
 Base = declarative_base()
 
+# Server default for primary keys: a random v4 UUID with the Unix time in
+# milliseconds written over its first 48 bits and the version nibble changed
+# from 4 to 7. Shared by the migration that adds it and by create_all.
+GEN_UUID_V7_SQL = """
+    CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS uuid AS $$
+        SELECT encode(
+            set_bit(
+                set_bit(
+                    overlay(
+                        uuid_send(gen_random_uuid())
+                        placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                        FROM 1 FOR 6
+                    ),
+                    52, 1
+                ),
+                53, 1
+            ),
+            'hex'
+        )::uuid
+    $$ LANGUAGE sql VOLATILE
+"""
+
+# Tables built with create_all (tests, init_db) need the function before
+# their id defaults can refer to it
+event.listen(Base.metadata, "before_create", DDL(GEN_UUID_V7_SQL))
+event.listen(Base.metadata, "after_drop", DDL("DROP FUNCTION IF EXISTS gen_uuid_v7()"))
+
+# Server default for created_at/updated_at. The columns hold naive UTC
+# timestamps, so now() is converted to UTC rather than the session time zone.
+UTC_NOW = text("timezone('utc', now())")
+
+# Columns declared with server_onupdate=FetchedValue() are bumped by a
+# BEFORE UPDATE trigger rather than by the ORM. Shared by the migration that
+# adds the triggers and by create_all.
+SET_UPDATED_AT_SQL = """
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at = timezone('utc', now());
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+def updated_at_trigger_sql(table_name: str) -> str:
+    """Return the CREATE TRIGGER statement that keeps a table's updated_at current."""
+    return (
+        f'CREATE TRIGGER set_updated_at BEFORE UPDATE ON {table_name} '
+        'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+    )
+
+
+def _create_updated_at_triggers(metadata, connection, tables=(), **kw) -> None:
+    """Add the updated_at trigger to each table create_all built that needs it."""
+    for table in tables:
+        updated_at = table.c.get("updated_at")
+        if updated_at is not None and updated_at.server_onupdate is not None:
+            connection.execute(DDL(updated_at_trigger_sql(table.name)))
+
+
+event.listen(Base.metadata, "before_create", DDL(SET_UPDATED_AT_SQL))
+event.listen(Base.metadata, "after_create", _create_updated_at_triggers)
+event.listen(Base.metadata, "after_drop", DDL("DROP FUNCTION IF EXISTS set_updated_at()"))
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds, so later keys sort
+    later and inserts append to the primary key index instead of landing on
+    random pages. Matches the gen_uuid_v7() server default.
 
-async def get_db() -> AsyncSession:
+    Returns:
+        New UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | (0x7 << 76)  # version 7
+    value = value & ~(0x3 << 62) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+# Requests that never write; they get an AUTOCOMMIT session and are not
+# committed. A read route that does write declares require_transaction.
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def require_transaction(request: Request) -> None:
+    """
+    Route dependency keeping a read request's session transactional.
+
+    For GET routes that write (e.g. generating missing tech routes), so
+    their statements commit together when the handler commits. Declare it
+    in the route decorator so it runs before get_db:
+
+        @router.get("/...", dependencies=[Depends(require_transaction)])
+    """
+    request.state.require_transaction = True
+
+
+async def get_db(request: Request) -> AsyncSession:
     """
     Dependency injection for database sessions.
 
+    Write requests run in a transaction committed when the handler returns;
+    read requests (GET/HEAD/OPTIONS) use an AUTOCOMMIT session unless the
+    route declares require_transaction (the handler then commits itself).
+
     Usage in FastAPI endpoints:
         @router.get("/customers")
         async def get_customers(db: AsyncSession = Depends(get_db)):
             ...
     """
-    async with AsyncSessionLocal() as session:
+    read_only = request.method in READ_ONLY_METHODS
+    autocommit = read_only and not getattr(request.state, "require_transaction", False)
+    session_factory = ReadOnlySessionLocal if autocommit else AsyncSessionLocal
+
+    async with session_factory() as session:
         try:
             yield session
-            await session.commit()
+            if not read_only:
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -48,6 +186,23 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+async def warm_pool(connections: int) -> None:
+    """
+    Open pool connections ahead of the first requests.
+
+    SQLAlchemy creates connections lazily, so without this the first burst
+    of traffic after a deploy pays for connection setup.
+
+    Args:
+        connections: Number of connections to open concurrently
+    """
+    async def _warm_connection() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_warm_connection() for _ in range(connections)))
+
+
 async def init_db() -> None:
     """
     Initialize database tables.
@@ -7,12 +7,15 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import raiseload
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel
+from dataclasses import dataclass
+import hashlib
 
 from app.database import get_db
 from app.services.auth import AuthService
+from app.services.cache import auth_cache
 from app.models.user import User
 from app.models.organization import Organization
 
@@ -20,9 +23,19 @@ from app.models.organization import Organization
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+# Role sets for the convenience dependencies below
+ADMIN_ROLES = frozenset(("owner", "admin"))
+MANAGER_ROLES = frozenset(("owner", "admin", "manager"))
 
-class AuthContext(BaseModel):
-    """Authentication context extracted from JWT token."""
+
+@dataclass(slots=True)
+class AuthContext:
+    """
+    Authentication context extracted from JWT token.
+
+    A plain dataclass rather than a Pydantic model: it is built on every
+    authenticated request from claims _context_from_token has already parsed.
+    """
 
     user_id: UUID
     organization_id: UUID
@@ -32,28 +45,20 @@ class AuthContext(BaseModel):
     user: Optional[User] = None
     organization: Optional[Organization] = None
 
-    model_config = {"arbitrary_types_allowed": True}
-
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> AuthContext:
+def _context_from_token(token: str) -> AuthContext:
     """
-    Validate JWT token and return authentication context.
+    Decode a JWT and build an authentication context from its claims.
 
     Args:
-        credentials: HTTP Bearer token from Authorization header
-        db: Database session
+        token: Bearer token
 
     Returns:
-        AuthContext with user_id, organization_id, role, and email
+        AuthContext without user/organization records
 
     Raises:
-        HTTPException: 401 if token is invalid or expired
+        HTTPException: 401 if token is invalid, expired, or malformed
     """
-    token = credentials.credentials
-
     # Decode and validate token
     payload = AuthService.decode_token(token)
     if not payload:
@@ -65,11 +70,18 @@ async def get_current_user(
 
     # Extract claims from token
     try:
-        user_id = UUID(payload.get("user_id"))
-        organization_id = UUID(payload.get("organization_id"))
         role = payload.get("role")
         email = payload.get("email")
-        tech_id = UUID(payload.get("tech_id")) if payload.get("tech_id") else None
+        if not isinstance(role, str) or not isinstance(email, str):
+            raise TypeError("role and email claims must be strings")
+
+        return AuthContext(
+            user_id=UUID(payload.get("user_id")),
+            organization_id=UUID(payload.get("organization_id")),
+            role=role,
+            email=email,
+            tech_id=UUID(payload.get("tech_id")) if payload.get("tech_id") else None
+        )
     except (ValueError, TypeError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -77,19 +89,40 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Verify user exists and is active
+
+async def _load_user_and_organization(context: AuthContext, db: AsyncSession) -> None:
+    """
+    Load the context's user and organization, verifying both are active.
+
+    Args:
+        context: Context built from token claims; user/organization are set on it
+        db: Database session
+
+    Raises:
+        HTTPException: 401 if either record is missing, 403 if either is disabled
+    """
+    # Fetch user and organization in one round trip; users belong to
+    # organizations through OrganizationUser, so join on the token's
+    # organization id (outer, so a missing organization still returns the user).
+    # Relationships raise instead of lazy loading; callers that need related
+    # rows must load them explicitly.
     result = await db.execute(
-        select(User).where(User.id == user_id)
+        select(User, Organization)
+        .options(raiseload("*"))
+        .outerjoin(Organization, Organization.id == context.organization_id)
+        .where(User.id == context.user_id)
     )
-    user = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not user:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    user, organization = row
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -97,11 +130,6 @@ async def get_current_user(
         )
 
     # Verify organization exists and is active
-    result = await db.execute(
-        select(Organization).where(Organization.id == organization_id)
-    )
-    organization = result.scalar_one_or_none()
-
     if not organization:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -115,18 +143,71 @@ async def get_current_user(
             detail="Organization is disabled"
         )
 
-    return AuthContext(
-        user_id=user_id,
-        organization_id=organization_id,
-        role=role,
-        email=email,
-        tech_id=tech_id,
-        user=user,
-        organization=organization
-    )
+    context.user = user
+    context.organization = organization
 
 
-async def require_role(*allowed_roles: str):
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> AuthContext:
+    """
+    Validate JWT token and return authentication context.
+
+    The user/organization active check is cached per token for a short TTL,
+    so the returned context does not carry the User and Organization
+    records. Endpoints that need them use get_current_user_with_records.
+
+    Args:
+        credentials: HTTP Bearer token from Authorization header
+        db: Database session
+
+    Returns:
+        AuthContext with user_id, organization_id, role, and email
+
+    Raises:
+        HTTPException: 401 if token is invalid or expired
+    """
+    token = credentials.credentials
+    context = _context_from_token(token)
+
+    token_hash = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    if auth_cache.get(context.organization_id, token_hash):
+        return context
+
+    await _load_user_and_organization(context, db)
+    auth_cache.set(context.organization_id, token_hash, True)
+
+    # Keep the records off the context so cached and uncached calls match
+    context.user = None
+    context.organization = None
+    return context
+
+
+async def get_current_user_with_records(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> AuthContext:
+    """
+    Validate JWT token and return authentication context with the User and
+    Organization records loaded (never cached).
+
+    Args:
+        credentials: HTTP Bearer token from Authorization header
+        db: Database session
+
+    Returns:
+        AuthContext with user and organization set
+
+    Raises:
+        HTTPException: 401 if token is invalid or expired
+    """
+    context = _context_from_token(credentials.credentials)
+    await _load_user_and_organization(context, db)
+    return context
+
+
+def require_role(*allowed_roles: str):
     """
     Dependency factory to require specific roles.
 
@@ -143,13 +224,17 @@ async def require_role(*allowed_roles: str):
     Returns:
         Dependency function that validates role
     """
+    # Built once per factory call, not on every request
+    allowed = frozenset(allowed_roles)
+    detail = f"Insufficient permissions. Required roles: {', '.join(allowed_roles)}"
+
     async def role_checker(
         auth: AuthContext = Depends(get_current_user)
     ) -> AuthContext:
-        if auth.role not in allowed_roles:
+        if auth.role not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient permissions. Required roles: {', '.join(allowed_roles)}"
+                detail=detail
             )
         return auth
 
@@ -173,7 +258,7 @@ async def require_admin(
     auth: AuthContext = Depends(get_current_user)
 ) -> AuthContext:
     """Require 'owner' or 'admin' role."""
-    if auth.role not in ("owner", "admin"):
+    if auth.role not in ADMIN_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin role required"
@@ -185,7 +270,7 @@ async def require_manager(
     auth: AuthContext = Depends(get_current_user)
 ) -> AuthContext:
     """Require 'owner', 'admin', or 'manager' role."""
-    if auth.role not in ("owner", "admin", "manager"):
+    if auth.role not in MANAGER_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Manager role required"
@@ -3,10 +3,19 @@ FastAPI application entry point.
 """
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import select, case, or_, literal_column
 from app.config import settings
+from app.database import AsyncSessionLocal, warm_pool
+from app.models.customer import Customer
+from app.services.geocoding import geocoding_service, pairs_farther_than
+from app.services.maintenance import maintenance_service
+from typing import AsyncIterator, List
+import asyncio
 import logging
+import orjson
 
 # Configure logging
 logging.basicConfig(
@@ -23,19 +32,22 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Configure CORS (skipped when a reverse proxy handles it)
+if settings.enable_cors_middleware:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins_list,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=["Authorization", "Content-Type"],
+    )
 
-# Mount static files (frontend)
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# Mount static files (frontend), unless a reverse proxy/CDN serves them
+if settings.serve_static:
+    app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
 # Health check endpoint
@@ -53,7 +65,6 @@ async def health_check():
 @app.get("/")
 async def root():
     """Root endpoint - redirect to login page."""
-    from fastapi.responses import RedirectResponse
     return RedirectResponse(url="/static/login.html")
 
 
@@ -79,8 +90,6 @@ async def geocode_address(address: str):
     Returns:
         Dict with latitude and longitude, or error message
     """
-    from app.services.geocoding import geocoding_service
-
     if not address:
         return {"error": "Address parameter is required"}
 
@@ -107,105 +116,191 @@ async def geocode_address(address: str):
         }
 
 
-# Validate customer coordinates endpoint
-@app.get("/api/customers/validate-coordinates")
-async def validate_customer_coordinates():
+# Rows fetched per round-trip when streaming customers for validation
+VALIDATION_FETCH_SIZE = 1000
+
+# Missing (NULL or 0, as before) and out-of-range coordinates are
+# classified by the database; only rows with no issue need geocoding.
+# Inline literals keep the CASE result typed as text for asyncpg.
+COORDINATE_ISSUE_MESSAGES = {
+    "missing": "Missing coordinates",
+    "out_of_range": "Coordinates out of valid range",
+}
+COORDINATE_ISSUE = case(
+    (
+        or_(
+            Customer.latitude.is_(None), Customer.longitude.is_(None),
+            Customer.latitude == 0, Customer.longitude == 0
+        ),
+        literal_column("'missing'")
+    ),
+    (
+        or_(
+            Customer.latitude < -90, Customer.latitude > 90,
+            Customer.longitude < -180, Customer.longitude > 180
+        ),
+        literal_column("'out_of_range'")
+    ),
+    else_=None
+).label("coordinate_issue")
+
+
+def _customer_issue(customer, message: str, severity: str) -> dict:
     """
-    Validate all customer coordinates against their addresses.
+    Build a validation issue entry for a customer row.
+
+    Args:
+        customer: Row with id, name, address, latitude and longitude
+        message: Description of the problem
+        severity: high, medium or low
 
-    Returns a list of customers with mismatched or invalid coordinates.
+    Returns:
+        Issue dict as reported by validate_customer_coordinates
     """
-    from app.services.geocoding import geocoding_service
-    from app.database import get_db
-    from app.models.customer import Customer
-    from sqlalchemy import select
-    import math
+    return {
+        "id": customer.id,
+        "name": customer.name,
+        "address": customer.address,
+        "current_latitude": customer.latitude,
+        "current_longitude": customer.longitude,
+        "issues": [message],
+        "severity": severity
+    }
 
-    async def calculate_distance(lat1, lon1, lat2, lon2):
-        """Calculate distance in miles between two coordinates."""
-        R = 3959  # Earth radius in miles
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
 
-        a = (math.sin(delta_lat / 2) ** 2 +
-             math.cos(lat1_rad) * math.cos(lat2_rad) *
-             math.sin(delta_lon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+async def _geocoded_coordinate_issues(customers: list) -> AsyncIterator[List[dict]]:
+    """
+    Compare customers' stored coordinates with their geocoded addresses.
 
-        return R * c
+    Args:
+        customers: Rows with id, name, address, latitude and longitude
 
-    issues = []
+    Yields:
+        Lists of issue dicts, one list per batch of finished lookups
+    """
+    async for batch in geocoding_service.geocode_many_as_completed(
+        [customer.address for customer in customers]
+    ):
+        found = []
+        # (customer, geocoded) pairs whose distance is checked in one batch
+        comparisons = []
+
+        for index, geocoded in batch:
+            customer = customers[index]
+            if isinstance(geocoded, Exception):
+                logger.error(f"Error validating customer {customer.id}: {str(geocoded)}")
+                found.append(_customer_issue(customer, f"Validation error: {str(geocoded)}", "low"))
+            elif geocoded:
+                comparisons.append((customer, geocoded))
+            else:
+                found.append(_customer_issue(customer, "Address could not be geocoded for validation", "low"))
+
+        if comparisons:
+            # Flag if coordinates are more than 5 miles off
+            distance_args = (
+                [customer.latitude for customer, _ in comparisons],
+                [customer.longitude for customer, _ in comparisons],
+                [geocoded[0] for _, geocoded in comparisons],
+                [geocoded[1] for _, geocoded in comparisons],
+                5.0
+            )
+            # Batches hold at most max_concurrency lookups, so the distance
+            # check is cheaper than a worker thread handoff
+            far_indices, distances = pairs_farther_than(*distance_args)
+
+            for index, distance in zip(far_indices.tolist(), distances.tolist()):
+                customer, (correct_lat, correct_lon) = comparisons[index]
+                issue = _customer_issue(
+                    customer,
+                    f"Coordinates {distance:.1f} miles from address",
+                    "high" if distance > 50 else "medium"
+                )
+                issue["correct_latitude"] = correct_lat
+                issue["correct_longitude"] = correct_lon
+                issue["distance_miles"] = round(distance, 2)
+                found.append(issue)
+
+        yield found
+
+
+async def _stream_coordinate_issues(
+    coordinate_issues: List[dict],
+    to_geocode: list,
+    total_customers: int
+) -> AsyncIterator[bytes]:
+    """
+    Encode the validation report as JSON, one issue at a time.
+
+    Issues found from the database are written first, then geocoding
+    results as lookups finish; the totals follow the list.
+    """
+    issues_found = 0
+    yield b'{"customers_with_issues":['
 
     try:
-        async for db in get_db():
-            # Get all active customers
-            result = await db.execute(select(Customer).where(Customer.is_active == True))
-            customers = result.scalars().all()
-
-            for customer in customers:
-                issue = {
-                    "id": str(customer.id),
-                    "name": customer.name,
-                    "address": customer.address,
-                    "current_latitude": customer.latitude,
-                    "current_longitude": customer.longitude,
-                    "issues": []
-                }
-
-                # Check if coordinates are missing
-                if not customer.latitude or not customer.longitude:
-                    issue["issues"].append("Missing coordinates")
-                    issue["severity"] = "high"
-                    issues.append(issue)
-                    continue
-
-                # Check if coordinates are valid ranges
-                if (customer.latitude < -90 or customer.latitude > 90 or
-                    customer.longitude < -180 or customer.longitude > 180):
-                    issue["issues"].append("Coordinates out of valid range")
-                    issue["severity"] = "high"
-                    issues.append(issue)
-                    continue
-
-                # Geocode the address to compare
-                try:
-                    geocoded = await geocoding_service.geocode_with_rate_limit(customer.address)
-
-                    if geocoded:
-                        correct_lat, correct_lon = geocoded
-                        distance = await calculate_distance(
-                            customer.latitude, customer.longitude,
-                            correct_lat, correct_lon
-                        )
-
-                        # Flag if coordinates are more than 5 miles off
-                        if distance > 5.0:
-                            issue["issues"].append(f"Coordinates {distance:.1f} miles from address")
-                            issue["correct_latitude"] = correct_lat
-                            issue["correct_longitude"] = correct_lon
-                            issue["distance_miles"] = round(distance, 2)
-                            issue["severity"] = "high" if distance > 50 else "medium"
-                            issues.append(issue)
-                    else:
-                        issue["issues"].append("Address could not be geocoded for validation")
-                        issue["severity"] = "low"
-                        issues.append(issue)
+        for issue in coordinate_issues:
+            yield (b"," if issues_found else b"") + orjson.dumps(issue)
+            issues_found += 1
 
-                except Exception as e:
-                    logger.error(f"Error validating customer {customer.id}: {str(e)}")
-                    issue["issues"].append(f"Validation error: {str(e)}")
-                    issue["severity"] = "low"
-                    issues.append(issue)
+        async for found in _geocoded_coordinate_issues(to_geocode):
+            for issue in found:
+                yield (b"," if issues_found else b"") + orjson.dumps(issue)
+                issues_found += 1
 
-            break  # Exit the async generator loop
+        yield f'],"total_customers":{total_customers},"issues_found":{issues_found}}}'.encode()
 
-        return {
-            "total_customers": len(customers),
-            "issues_found": len(issues),
-            "customers_with_issues": issues
-        }
+    except Exception as e:
+        # Headers are already sent; close the document with the error instead
+        logger.error(f"Error validating coordinates: {str(e)}")
+        yield b'],"error":' + orjson.dumps(f"Validation failed: {str(e)}") + b"}"
+
+
+# Validate customer coordinates endpoint
+@app.get("/api/customers/validate-coordinates")
+async def validate_customer_coordinates():
+    """
+    Validate all customer coordinates against their addresses.
+
+    Returns a list of customers with mismatched or invalid coordinates. The
+    response is streamed: customers_with_issues grows as address lookups
+    finish (so it is not in customer order), and total_customers and
+    issues_found come after it.
+    """
+    # Missing/out-of-range coordinates, known before any geocoding
+    coordinate_issues = []
+    # Rows that need a geocode lookup to compare against
+    to_geocode = []
+    total_customers = 0
+
+    try:
+        async with AsyncSessionLocal() as db:
+            # Stream active customers as plain rows (no ORM instances) in
+            # partitions, so the full result set is never buffered at once
+            result = await db.stream(
+                select(
+                    Customer.id,
+                    Customer.name,
+                    Customer.address,
+                    Customer.latitude,
+                    Customer.longitude,
+                    COORDINATE_ISSUE
+                )
+                .where(Customer.is_active == True)
+                .execution_options(yield_per=VALIDATION_FETCH_SIZE)
+            )
+
+            async for partition in result.partitions():
+                total_customers += len(partition)
+
+                for customer in partition:
+                    if customer.coordinate_issue:
+                        coordinate_issues.append(_customer_issue(
+                            customer,
+                            COORDINATE_ISSUE_MESSAGES[customer.coordinate_issue],
+                            "high"
+                        ))
+                    else:
+                        to_geocode.append(customer)
 
     except Exception as e:
         logger.error(f"Error validating coordinates: {str(e)}")
@@ -213,6 +308,13 @@ async def validate_customer_coordinates():
             "error": f"Validation failed: {str(e)}"
         }
 
+    # The session is closed before streaming, so no pool connection is held
+    # while addresses are geocoded
+    return StreamingResponse(
+        _stream_coordinate_issues(coordinate_issues, to_geocode, total_customers),
+        media_type="application/json"
+    )
+
 
 # Import and include routers
 from app.api import auth, customers, techs, routes, imports, visits, issues, services
@@ -232,8 +334,27 @@ async def startup_event():
     logger.info(f"Starting QuantumPools in {settings.environment} mode")
     logger.info(f"Database: {settings.database_url.split('@')[-1]}")  # Don't log password
 
+    # Open the pool's connections up front so the first requests after a
+    # deploy don't each pay for connection setup
+    if settings.is_production:
+        try:
+            await warm_pool(settings.db_pool_size)
+        except Exception:
+            logger.warning("Database pool warm-up failed", exc_info=True)
+
+    # Prune expired temp assignments in the background instead of per request
+    app.state.maintenance_task = asyncio.create_task(maintenance_service.run_periodic_cleanup())
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown."""
     logger.info("Shutting down QuantumPools")
+
+    maintenance_task = getattr(app.state, "maintenance_task", None)
+    if maintenance_task:
+        maintenance_task.cancel()
+        try:
+            await maintenance_task
+        except asyncio.CancelledError:
+            pass
@@ -3,13 +3,14 @@ Customer database model.
 Stores customer information including address, service preferences, and constraints.
 """
 
-from sqlalchemy import Column, String, Float, Integer, Time, DateTime, Boolean, ForeignKey, Numeric
+from sqlalchemy import Column, String, Float, Integer, Time, DateTime, Boolean, ForeignKey, Numeric, Index, Computed, FetchedValue, cast, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional, Union
 
-from app.database import Base
+from app.database import Base, UTC_NOW, uuid7
 
 
 class Customer(Base):
@@ -18,7 +19,9 @@ class Customer(Base):
     __tablename__ = "customers"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    # Time-ordered UUIDv7 (client or database generated); the primary key
+    # constraint already indexes it
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"))
 
     # Multi-tenancy
     organization_id = Column(
@@ -80,12 +83,21 @@ class Customer(Base):
         default=1,
         comment="1-5 difficulty scale affecting service duration"
     )
+    # Generated by the database from visit_duration and difficulty
+    # (1=easy, 5=very hard): +5 min per difficulty level
+    base_service_duration = Column(
+        Integer,
+        Computed("visit_duration + (difficulty - 1) * 5", persisted=True),
+        nullable=False,
+        comment="Service duration in minutes used by route optimization"
+    )
 
     # Scheduling
+    # Indexed through ix_customers_active_org_day (every customer query
+    # is organization scoped)
     service_day = Column(
         String(20),
         nullable=False,
-        index=True,
         comment="Primary service day: monday, tuesday, wednesday, thursday, friday, saturday, sunday"
     )
     service_days_per_week = Column(
@@ -119,10 +131,11 @@ class Customer(Base):
     )
 
     # Billing and payment information
-    service_rate = Column(
-        Numeric(10, 2),
+    # Exposed in dollars through the service_rate hybrid property
+    service_rate_cents = Column(
+        Integer,
         nullable=True,
-        comment="Service rate amount (e.g., 125.00 for $125)"
+        comment="Service rate in cents (e.g., 12500 for $125)"
     )
     billing_frequency = Column(
         String(20),
@@ -168,43 +181,77 @@ class Customer(Base):
     notes = Column(String(1000), nullable=True)
     status = Column(String(20), nullable=False, default='active', comment="Customer status: pending, active, inactive")
     is_active = Column(Boolean, nullable=False, default=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=UTC_NOW)
     updated_at = Column(
         DateTime,
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=UTC_NOW,
+        server_onupdate=FetchedValue()
     )
 
     # Relationships
     organization = relationship("Organization", back_populates="customers")
+    # Every CustomerResponse includes the assigned tech, so load it with the
+    # customer (also on refresh) instead of lazily
     assigned_tech = relationship(
         "Tech",
-        foreign_keys=[assigned_tech_id]
+        foreign_keys=[assigned_tech_id],
+        lazy="joined"
     )
+    # route_stops.customer_id is ON DELETE CASCADE, so the database removes
+    # the stops without the ORM loading them first
     route_stops = relationship(
         "RouteStop",
         back_populates="customer",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     visits = relationship("Visit", back_populates="customer", cascade="all, delete-orphan")
     issues = relationship("Issue", back_populates="customer", cascade="all, delete-orphan")
 
+    # Indexes
+    __table_args__ = (
+        # Route building and the map only read active customers; inactive
+        # rows are left out of the index entirely
+        Index(
+            'ix_customers_active_org_day',
+            'organization_id',
+            'service_day',
+            postgresql_where=text('is_active = true')
+        ),
+        # Backs the customer list status filter
+        Index('ix_customers_org_status', 'organization_id', 'status'),
+    )
+
+    # Fetch base_service_duration and the timestamps with RETURNING after
+    # every insert/update, so they never have to be lazily reloaded
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<Customer(id={self.id}, display_name='{self.display_name}', service_day='{self.service_day}')>"
 
-    @property
-    def base_service_duration(self) -> int:
+    @hybrid_property
+    def service_rate(self) -> Optional[Decimal]:
         """
-        Calculate service duration in minutes based on visit_duration and difficulty.
+        Service rate in dollars, stored as integer cents.
 
         Returns:
-            int: Service duration in minutes
+            Decimal: Rate with two decimal places, or None if not set
         """
-        # Use the visit_duration field as base time
-        base_time = self.visit_duration
+        if self.service_rate_cents is None:
+            return None
+        return Decimal(self.service_rate_cents).scaleb(-2)
 
-        # Adjust for difficulty (1=easy, 5=very hard)
-        difficulty_adjustment = (self.difficulty - 1) * 5  # +5 min per difficulty level
+    @service_rate.inplace.setter
+    def _service_rate_setter(self, value: Optional[Union[Decimal, float, int]]) -> None:
+        if value is None:
+            self.service_rate_cents = None
+        else:
+            cents = (Decimal(str(value)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+            self.service_rate_cents = int(cents)
 
-        return base_time + difficulty_adjustment
+    @service_rate.inplace.expression
+    @classmethod
+    def _service_rate_expression(cls):
+        """Rate in dollars computed from the cents column."""
+        return cast(cls.service_rate_cents, Numeric(10, 2)) / 100
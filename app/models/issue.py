@@ -2,13 +2,12 @@
 Issue model for tracking problems found during service visits.
 """
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, FetchedValue, text
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
-import uuid
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime
 
-from app.database import Base
+from app.database import Base, UTC_NOW, uuid7
 
 
 class Issue(Base):
@@ -19,7 +18,7 @@ class Issue(Base):
     """
     __tablename__ = "issues"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"))
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False, index=True)
     customer_id = Column(UUID(as_uuid=True), ForeignKey("customers.id"), nullable=False, index=True)
     visit_id = Column(UUID(as_uuid=True), ForeignKey("visits.id"), nullable=True, index=True)  # Optional link to visit
@@ -31,7 +30,7 @@ class Issue(Base):
     # Issue details
     description = Column(Text, nullable=False)
     severity = Column(String(20), default="medium")  # low, medium, high, critical
-    photos = Column(JSON, nullable=True)  # Array of photo URLs/paths
+    photos = Column(JSONB, nullable=True)  # Array of photo URLs/paths
 
     # Status and assignment
     status = Column(String(20), default="pending")  # pending, scheduled, in_progress, resolved, closed
@@ -44,13 +43,25 @@ class Issue(Base):
     resolved_by_tech_id = Column(UUID(as_uuid=True), ForeignKey("techs.id"), nullable=True)
 
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue(), nullable=False)
 
     # Relationships
     organization = relationship("Organization", back_populates="issues")
-    customer = relationship("Customer", back_populates="issues")
+    # IssueResponse reports the customer and tech names, so these many-to-one
+    # relationships load with the issue (also on refresh) instead of lazily
+    customer = relationship("Customer", back_populates="issues", lazy="joined")
     visit = relationship("Visit", back_populates="issues")
-    reported_by = relationship("Tech", foreign_keys=[reported_by_tech_id], back_populates="reported_issues")
-    assigned_tech = relationship("Tech", foreign_keys=[assigned_tech_id], back_populates="assigned_issues")
-    resolved_by = relationship("Tech", foreign_keys=[resolved_by_tech_id], back_populates="resolved_issues")
+    reported_by = relationship("Tech", foreign_keys=[reported_by_tech_id], back_populates="reported_issues", lazy="joined")
+    assigned_tech = relationship("Tech", foreign_keys=[assigned_tech_id], back_populates="assigned_issues", lazy="joined")
+    resolved_by = relationship("Tech", foreign_keys=[resolved_by_tech_id], back_populates="resolved_issues", lazy="joined")
+
+    # Indexes
+    __table_args__ = (
+        # Backs the issue list status filter
+        Index('ix_issues_org_status', 'organization_id', 'status'),
+    )
+
+    # Read the server-generated timestamps back with RETURNING on insert and
+    # update, so they never have to be lazily reloaded
+    __mapper_args__ = {"eager_defaults": True}
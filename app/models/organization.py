@@ -3,13 +3,11 @@ Organization database model.
 Stores organization/tenant information for multi-tenancy.
 """
 
-from sqlalchemy import Column, String, Boolean, Integer, DateTime
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, FetchedValue, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
 
-from app.database import Base
+from app.database import Base, UTC_NOW, uuid7
 
 
 class Organization(Base):
@@ -18,7 +16,7 @@ class Organization(Base):
     __tablename__ = "organizations"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"), index=True)
 
     # Basic information
     name = Column(String(200), nullable=False)
@@ -44,7 +42,9 @@ class Organization(Base):
     max_routes_per_day = Column(Integer)
 
     # Features
-    features_enabled = Column(JSONB, default={})
+    # Callable default so each organization gets its own dict; the server
+    # default (set when the table was created) covers inserts outside the ORM
+    features_enabled = Column(JSONB, default=dict, server_default=text("'{}'::jsonb"))
 
     # Map provider
     default_map_provider = Column(String(50), default='openstreetmap')
@@ -58,8 +58,8 @@ class Organization(Base):
     # Metadata
     is_active = Column(Boolean, nullable=False, default=True)
     onboarded_at = Column(DateTime)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=UTC_NOW)
+    updated_at = Column(DateTime, nullable=False, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Relationships
     customers = relationship("Customer", back_populates="organization")
@@ -70,5 +70,9 @@ class Organization(Base):
     issues = relationship("Issue", back_populates="organization")
     service_catalog = relationship("ServiceCatalog", back_populates="organization")
 
+    # Read the server-generated timestamps back with RETURNING on insert and
+    # update, so they never have to be lazily reloaded
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<Organization(id={self.id}, name='{self.name}', slug='{self.slug}')>"
@@ -3,13 +3,11 @@ OrganizationUser database model.
 Junction table for many-to-many relationship between users and organizations.
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, UniqueConstraint, FetchedValue, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
 
-from app.database import Base
+from app.database import Base, UTC_NOW, uuid7
 
 
 class OrganizationUser(Base):
@@ -18,7 +16,7 @@ class OrganizationUser(Base):
     __tablename__ = "organization_users"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"), index=True)
 
     # Foreign keys
     organization_id = Column(
@@ -44,8 +42,8 @@ class OrganizationUser(Base):
     invited_by = Column(UUID(as_uuid=True), ForeignKey('users.id'))
 
     # Metadata
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=UTC_NOW)
+    updated_at = Column(DateTime, nullable=False, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Constraints
     __table_args__ = (
@@ -57,5 +55,9 @@ class OrganizationUser(Base):
     user = relationship("User", foreign_keys=[user_id], back_populates="organization_users")
     inviter = relationship("User", foreign_keys=[invited_by])
 
+    # Read the server-generated timestamps back with RETURNING on insert and
+    # update, so they never have to be lazily reloaded
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<OrganizationUser(user_id={self.user_id}, org_id={self.organization_id}, role='{self.role}')>"
@@ -3,13 +3,11 @@ Route and RouteStop database models.
 Represents optimized routes assigned to techs (technicians).
 """
 
-from sqlalchemy import Column, String, Integer, Float, Time, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, Time, DateTime, ForeignKey, Index, FetchedValue, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
 
-from app.database import Base
+from app.database import Base, UTC_NOW, uuid7
 
 
 class Route(Base):
@@ -18,7 +16,7 @@ class Route(Base):
     __tablename__ = "routes"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"), index=True)
 
     # Multi-tenancy
     organization_id = Column(
@@ -38,10 +36,11 @@ class Route(Base):
     )
 
     # Route details
+    # Indexed through ix_routes_org_day_tech (every per-day lookup is
+    # organization scoped)
     service_day = Column(
         String(20),
         nullable=False,
-        index=True,
         comment="monday, tuesday, wednesday, thursday, friday, saturday, sunday"
     )
 
@@ -76,24 +75,45 @@ class Route(Base):
     )
 
     # Metadata
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    # Indexed through ix_routes_created_brin
+    created_at = Column(DateTime, nullable=False, server_default=UTC_NOW)
     updated_at = Column(
         DateTime,
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=UTC_NOW,
+        server_onupdate=FetchedValue()
     )
 
     # Relationships
     organization = relationship("Organization", back_populates="routes")
     tech = relationship("Tech", back_populates="routes")
+    # route_stops.route_id is ON DELETE CASCADE; passive_deletes leaves
+    # removing the stops to that instead of loading and deleting each one
     stops = relationship(
         "RouteStop",
         back_populates="route",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="RouteStop.sequence"
     )
 
+    # Indexes
+    __table_args__ = (
+        Index('ix_routes_org_day_tech', 'organization_id', 'service_day', 'tech_id'),
+        # Rows are inserted in created_at order, so a BRIN index serves time
+        # range scans at a fraction of a B-tree's size and write cost
+        Index(
+            'ix_routes_created_brin',
+            'created_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        ),
+    )
+
+    # Read the server-generated timestamps back with RETURNING on insert and
+    # update, so they never have to be lazily reloaded
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return (
             f"<Route(id={self.id}, tech_id={self.tech_id}, "
@@ -107,14 +127,14 @@ class RouteStop(Base):
     __tablename__ = "route_stops"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"), index=True)
 
     # Foreign keys
+    # Indexed through ix_route_stops_route_covering
     route_id = Column(
         UUID(as_uuid=True),
         ForeignKey("routes.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     customer_id = Column(
         UUID(as_uuid=True),
@@ -153,12 +173,24 @@ class RouteStop(Base):
     )
 
     # Metadata
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=UTC_NOW)
 
     # Relationships
     route = relationship("Route", back_populates="stops")
     customer = relationship("Customer", back_populates="route_stops")
 
+    # Indexes
+    __table_args__ = (
+        # Route rendering reads a route's stops in sequence order along with
+        # these columns; INCLUDE lets Postgres answer it with an index-only scan
+        Index(
+            'ix_route_stops_route_covering',
+            'route_id',
+            'sequence',
+            postgresql_include=['customer_id', 'estimated_service_duration']
+        ),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<RouteStop(id={self.id}, route_id={self.route_id}, "
@@ -3,12 +3,11 @@ Service Catalog model - standardized list of services.
 """
 
 import uuid
-from sqlalchemy import Column, String, Integer, Boolean, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Boolean, Text, DateTime, ForeignKey, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
 
-from app.database import Base
+from app.database import Base, UTC_NOW
 
 
 class ServiceCatalog(Base):
@@ -28,9 +27,13 @@ class ServiceCatalog(Base):
     is_active = Column(Boolean, default=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Relationships
     organization = relationship("Organization", back_populates="service_catalog")
     visit_services = relationship("VisitService", back_populates="service")
+
+    # Read the server-generated timestamps back with RETURNING on insert and
+    # update, so they never have to be lazily reloaded
+    __mapper_args__ = {"eager_defaults": True}
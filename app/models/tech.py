@@ -3,13 +3,13 @@ Tech (Technician) database model.
 Stores technician information including start/end locations and working hours.
 """
 
-from sqlalchemy import Column, String, Float, Integer, Time, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, Float, Integer, Time, DateTime, Boolean, ForeignKey, Index, cast, extract, FetchedValue, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import datetime
-import uuid
 
-from app.database import Base
+from app.database import Base, UTC_NOW, uuid7
 
 
 class Tech(Base):
@@ -18,7 +18,7 @@ class Tech(Base):
     __tablename__ = "techs"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"), index=True)
 
     # Multi-tenancy
     organization_id = Column(
@@ -111,12 +111,12 @@ class Tech(Base):
 
     # Metadata
     notes = Column(String(1000), nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=UTC_NOW)
     updated_at = Column(
         DateTime,
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=UTC_NOW,
+        server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -132,17 +132,36 @@ class Tech(Base):
     assigned_issues = relationship("Issue", foreign_keys="Issue.assigned_tech_id", back_populates="assigned_tech")
     resolved_issues = relationship("Issue", foreign_keys="Issue.resolved_by_tech_id", back_populates="resolved_by")
 
+    # Indexes
+    __table_args__ = (
+        # Backs the active tech lookups (ordered by name) used when building routes
+        Index('ix_techs_active_org_name', 'organization_id', 'name', postgresql_where=text('is_active = true')),
+    )
+
+    # Read the server-generated timestamps back with RETURNING on insert and
+    # update, so they never have to be lazily reloaded
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<Tech(id={self.id}, name='{self.name}', is_active={self.is_active})>"
 
-    @property
+    @hybrid_property
     def working_hours_duration(self) -> int:
         """
         Calculate total working hours in minutes.
 
+        A hybrid property; in SQL it is computed from the time columns
+        (e.g. select(Tech.id, Tech.working_hours_duration)).
+
         Returns:
             int: Working hours in minutes
         """
         start_minutes = self.working_hours_start.hour * 60 + self.working_hours_start.minute
         end_minutes = self.working_hours_end.hour * 60 + self.working_hours_end.minute
         return end_minutes - start_minutes
+
+    @working_hours_duration.inplace.expression
+    @classmethod
+    def _working_hours_duration_expression(cls):
+        """Working minutes from Postgres time arithmetic (time - time is an interval)."""
+        return cast(extract("epoch", cls.working_hours_end - cls.working_hours_start) / 60, Integer)
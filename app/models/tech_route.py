@@ -3,13 +3,42 @@ Tech Route Model
 Stores persistent routes for each tech on each service day
 """
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Date, Float, Integer, Index
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, DateTime, ForeignKey, Date, Float, Integer, Index, FetchedValue, LargeBinary, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime, date
+from sqlalchemy.types import TypeDecorator
+from typing import List, Optional, Sequence, Union
+from datetime import date
 import uuid
 
-from app.database import Base
+from app.database import Base, UTC_NOW, uuid7
+
+
+class PackedUUIDList(TypeDecorator):
+    """
+    Ordered list of UUIDs stored as concatenated 16-byte values (bytea).
+
+    Python code sees a list of UUID strings; the database holds 16 bytes per
+    id instead of ~38 bytes of JSON text, and reads need no JSON parsing.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(
+        self,
+        value: Optional[Sequence[Union[str, uuid.UUID]]],
+        dialect
+    ) -> Optional[bytes]:
+        if value is None:
+            return None
+        return b"".join(uuid.UUID(str(item)).bytes for item in value)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[List[str]]:
+        if value is None:
+            return None
+        value = bytes(value)
+        return [str(uuid.UUID(bytes=value[i:i + 16])) for i in range(0, len(value), 16)]
 
 
 class TechRoute(Base):
@@ -19,16 +48,16 @@ class TechRoute(Base):
     """
     __tablename__ = "tech_routes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_uuid_v7()"))
     organization_id = Column(UUID(as_uuid=True), ForeignKey('organizations.id'), nullable=False)
     tech_id = Column(UUID(as_uuid=True), ForeignKey('techs.id'), nullable=False)
     service_day = Column(String(20), nullable=False)  # monday, tuesday, etc.
     route_date = Column(Date, nullable=False, default=date.today)
-    stop_sequence = Column(JSONB, nullable=False)  # Array of customer IDs in order
+    stop_sequence = Column(PackedUUIDList, nullable=False)  # Customer IDs in order
     total_distance = Column(Float, nullable=True)  # Miles
     total_duration = Column(Integer, nullable=True)  # Minutes
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=UTC_NOW)
+    updated_at = Column(DateTime, nullable=False, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Relationships
     organization = relationship("Organization")
@@ -38,4 +67,9 @@ class TechRoute(Base):
     __table_args__ = (
         Index('ix_tech_routes_org_date', 'organization_id', 'route_date'),
         Index('ix_tech_routes_tech_day_date', 'tech_id', 'service_day', 'route_date', unique=True),
+        Index('ix_tech_routes_org_day_date', 'organization_id', 'service_day', 'route_date'),
     )
+
+    # Read the server-generated timestamps back with RETURNING on insert and
+    # update, so they never have to be lazily reloaded
+    __mapper_args__ = {"eager_defaults": True}
@@ -36,4 +36,5 @@ class TempTechAssignment(Base):
     __table_args__ = (
         Index('ix_temp_assignments_customer_day', 'customer_id', 'service_day', 'assignment_date'),
         Index('ix_temp_assignments_org_date', 'organization_id', 'assignment_date'),
+        Index('ix_temp_assignments_org_day_date', 'organization_id', 'service_day', 'assignment_date'),
     )
@@ -2,9 +2,9 @@
 Visit model for tracking tech service visits to customer properties.
 """
 
-from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, Boolean, JSON
+from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 from datetime import datetime
 
@@ -35,7 +35,7 @@ class Visit(Base):
     # Service details
     service_performed = Column(Text, nullable=True)  # What work was done
     notes = Column(Text, nullable=True)  # General notes/comments
-    photos = Column(JSON, nullable=True)  # Array of photo URLs/paths
+    photos = Column(JSONB, nullable=True)  # Array of photo URLs/paths
 
     # Status tracking
     status = Column(String(20), default="scheduled")  # scheduled, in_progress, completed, cancelled, no_show
@@ -51,3 +51,11 @@ class Visit(Base):
     tech = relationship("Tech", back_populates="visits")
     issues = relationship("Issue", back_populates="visit", cascade="all, delete-orphan")
     services = relationship("VisitService", back_populates="visit", cascade="all, delete-orphan")
+
+    # Indexes backing the visit list filters (ordered by scheduled_date)
+    __table_args__ = (
+        Index('ix_visits_org_scheduled', 'organization_id', 'scheduled_date'),
+        Index('ix_visits_org_tech_scheduled', 'organization_id', 'tech_id', 'scheduled_date'),
+        Index('ix_visits_org_customer_scheduled', 'organization_id', 'customer_id', 'scheduled_date'),
+        Index('ix_visits_org_status', 'organization_id', 'status'),
+    )
@@ -186,6 +186,20 @@ class CustomerUpdate(BaseModel):
     payment_brand: Optional[str] = Field(None, max_length=50)
 
 
+class CustomerCoordinates(BaseModel):
+    """Corrected coordinates for one customer."""
+
+    id: UUID
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
+
+
+class CustomerCoordinatesUpdate(BaseModel):
+    """Schema for applying corrected coordinates to many customers at once."""
+
+    customers: list[CustomerCoordinates] = Field(..., min_length=1, max_length=5000)
+
+
 class CustomerResponse(CustomerBase):
     """Schema for customer responses (includes database fields)."""
 
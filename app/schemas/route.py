@@ -16,7 +16,7 @@ class RouteOptimizationRequest(BaseModel):
         pattern="^(selected_day|entire_week|complete_rerouting)$",
         description="Optimization scope: 'selected_day', 'entire_week', or 'complete_rerouting'"
     )
-    selected_tech_ids: Optional[List[str]] = Field(
+    selected_tech_ids: Optional[List[UUID]] = Field(
         None,
         description="List of tech IDs to optimize (null for complete_rerouting)"
     )
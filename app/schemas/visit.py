@@ -2,7 +2,7 @@
 Pydantic schemas for Visit model.
 """
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, AliasPath, field_validator
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
@@ -47,16 +47,34 @@ class VisitResponse(VisitBase):
     updated_at: datetime
     completed_at: Optional[datetime] = None
 
-    # Related data
-    customer_name: Optional[str] = None
-    customer_address: Optional[str] = None
-    tech_name: Optional[str] = None
+    # Related data, read straight from the loaded customer/tech relationships
+    customer_name: Optional[str] = Field(None, validation_alias=AliasPath('customer', 'display_name'))
+    customer_address: Optional[str] = Field(None, validation_alias=AliasPath('customer', 'address'))
+    tech_name: Optional[str] = Field(None, validation_alias=AliasPath('tech', 'name'))
     services: Optional[List[dict]] = None  # List of services performed
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    @field_validator('services', mode='before')
+    @classmethod
+    def flatten_services(cls, v):
+        """Convert loaded VisitService rows to plain dicts."""
+        if not v:
+            return []
+        return [
+            vs if isinstance(vs, dict) else {
+                "id": str(vs.id),
+                "service_catalog_id": str(vs.service_catalog_id) if vs.service_catalog_id else None,
+                "custom_service_name": vs.custom_service_name,
+                "notes": vs.notes,
+                "service_name": vs.service.name if vs.service else vs.custom_service_name
+            }
+            for vs in v
+        ]
 
 
 class VisitListResponse(BaseModel):
-    """Schema for list of visits."""
+    """Schema for a page of visits."""
     visits: List[VisitResponse]
-    total: int
+    total: int  # Number of visits in this page
+    next_cursor: Optional[str] = None  # Pass as ?cursor= to fetch the next page
@@ -0,0 +1,106 @@
+"""
+In-process TTL caches.
+Hold recently computed results (API responses, auth checks) per
+organization with a short TTL so repeated requests skip the rebuild.
+"""
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+from uuid import UUID
+import time
+
+from app.config import settings
+
+
+class ResponseCache:
+    """
+    TTL cache keyed by organization and an endpoint-specific key.
+
+    Data shared across organizations (e.g. geocoded addresses) is stored
+    under an organization_id of None.
+
+    Entries live in this process only; mutations that change the cached data
+    must call invalidate_organization().
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int = 1024):
+        """
+        Args:
+            ttl_seconds: Seconds an entry stays valid (0 disables caching)
+            max_entries: Maximum number of entries held at once
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[Optional[UUID], Hashable], Tuple[float, Any]] = {}
+
+    def get(self, organization_id: Optional[UUID], key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value if present and not expired.
+
+        Args:
+            organization_id: Organization the value belongs to
+            key: Endpoint-specific cache key
+
+        Returns:
+            Cached value or None
+        """
+        entry = self._entries.get((organization_id, key))
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[(organization_id, key)]
+            return None
+
+        return value
+
+    def set(self, organization_id: Optional[UUID], key: Hashable, value: Any) -> None:
+        """
+        Store a value for the configured TTL.
+
+        Args:
+            organization_id: Organization the value belongs to
+            key: Endpoint-specific cache key
+            value: Value to cache
+        """
+        if self.ttl_seconds <= 0:
+            return
+
+        now = time.monotonic()
+        if len(self._entries) >= self.max_entries:
+            self._evict(now)
+
+        self._entries[(organization_id, key)] = (now + self.ttl_seconds, value)
+
+    def invalidate_organization(self, organization_id: UUID) -> None:
+        """
+        Drop every cached entry for an organization.
+
+        Args:
+            organization_id: Organization whose data changed
+        """
+        for cache_key in [k for k in self._entries if k[0] == organization_id]:
+            del self._entries[cache_key]
+
+    def _evict(self, now: float) -> None:
+        """Remove expired entries, or the oldest entry if none have expired."""
+        expired = [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for cache_key in expired:
+            del self._entries[cache_key]
+
+        if not expired:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._entries[next(iter(self._entries))]
+
+
+# Global cache instance for the tech routes endpoint
+tech_routes_cache = ResponseCache(ttl_seconds=settings.tech_routes_cache_ttl_seconds)
+
+# Global cache of verified (active user, active organization) tokens
+auth_cache = ResponseCache(ttl_seconds=settings.auth_cache_ttl_seconds, max_entries=10000)
+
+# Global cache of geocoded addresses (shared across organizations)
+geocode_cache = ResponseCache(
+    ttl_seconds=settings.geocoding_cache_ttl_seconds,
+    max_entries=settings.geocoding_cache_max_entries
+)
@@ -5,14 +5,85 @@ Uses OpenStreetMap Nominatim (free) by default, with Google Maps API as optional
 
 from geopy.geocoders import Nominatim, GoogleV3
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
-from typing import Optional, Tuple
+from typing import Optional, Tuple, List, Union, Dict, AsyncIterator
 import logging
 import asyncio
+import numpy as np
 
 from app.config import settings
+from app.services.cache import geocode_cache
 
 logger = logging.getLogger(__name__)
 
+# Earth radius in miles
+EARTH_RADIUS_MILES = 3959
+
+
+def haversine_miles(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate Haversine distances between paired GPS coordinates in miles.
+
+    Args:
+        lat1, lon1: First coordinates of each pair (degrees)
+        lat2, lon2: Second coordinates of each pair (degrees)
+
+    Returns:
+        Array of distances in miles, one per pair
+    """
+    lat1 = np.radians(np.asarray(lat1, dtype=np.float64))
+    lon1 = np.radians(np.asarray(lon1, dtype=np.float64))
+    lat2 = np.radians(np.asarray(lat2, dtype=np.float64))
+    lon2 = np.radians(np.asarray(lon2, dtype=np.float64))
+
+    a = (np.sin((lat2 - lat1) / 2) ** 2 +
+         np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))
+
+
+def pairs_farther_than(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+    threshold_miles: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the coordinate pairs more than a threshold apart.
+
+    A cheap equirectangular estimate (one cosine per pair) rejects pairs
+    clearly within the threshold; only the rest get the exact Haversine
+    distance. The estimate is compared against 90% of the threshold, well
+    beyond its error at these distances, so no far pair is missed.
+
+    Args:
+        lat1, lon1: First coordinates of each pair (degrees)
+        lat2, lon2: Second coordinates of each pair (degrees)
+        threshold_miles: Distance pairs must exceed
+
+    Returns:
+        Tuple of (indices of the far pairs, their distances in miles)
+    """
+    lat1 = np.asarray(lat1, dtype=np.float64)
+    lon1 = np.asarray(lon1, dtype=np.float64)
+    lat2 = np.asarray(lat2, dtype=np.float64)
+    lon2 = np.asarray(lon2, dtype=np.float64)
+
+    dx = np.radians(lon2 - lon1) * np.cos(np.radians((lat1 + lat2) / 2))
+    dy = np.radians(lat2 - lat1)
+    estimate_sq = (dx * dx + dy * dy) * EARTH_RADIUS_MILES ** 2
+
+    candidates = np.flatnonzero(estimate_sq >= (0.9 * threshold_miles) ** 2)
+    distances = haversine_miles(lat1[candidates], lon1[candidates], lat2[candidates], lon2[candidates])
+
+    far = distances > threshold_miles
+    return candidates[far], distances[far]
+
 
 class GeocodingService:
     """Service for geocoding addresses to latitude/longitude coordinates."""
@@ -23,6 +94,7 @@ class GeocodingService:
             # Use Google Maps if API key is provided
             self.geocoder = GoogleV3(api_key=settings.google_maps_api_key)
             self.provider = "Google Maps"
+            self.max_concurrency = settings.geocoding_max_concurrency
         else:
             # Use free OpenStreetMap Nominatim
             self.geocoder = Nominatim(
@@ -30,11 +102,34 @@ class GeocodingService:
                 timeout=10
             )
             self.provider = "OpenStreetMap Nominatim"
+            # Nominatim allows 1 req/sec, so bulk lookups stay sequential
+            self.max_concurrency = 1
             logger.info(
                 "Using OpenStreetMap Nominatim for geocoding (rate limited to 1 req/sec). "
                 "Set GOOGLE_MAPS_API_KEY for production use."
             )
 
+        # In-flight lookups by normalized address, so concurrent requests for
+        # the same address share one provider call
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def _cache_key(address: str) -> str:
+        """Normalize an address for cache lookups."""
+        return " ".join(address.lower().split())
+
+    def get_cached(self, address: str) -> Optional[Tuple[float, float]]:
+        """
+        Get previously geocoded coordinates for an address, if cached.
+
+        Args:
+            address: Street address
+
+        Returns:
+            Tuple of (latitude, longitude) or None if not cached
+        """
+        return geocode_cache.get(None, self._cache_key(address))
+
     async def geocode_address(
         self,
         address: str,
@@ -43,6 +138,9 @@ class GeocodingService:
         """
         Geocode an address to latitude/longitude coordinates.
 
+        Successful results are cached by normalized address, and concurrent
+        lookups of the same address share a single provider call.
+
         Args:
             address: Street address to geocode
             retry_count: Number of retries on timeout (default: 3)
@@ -54,6 +152,31 @@ class GeocodingService:
             OpenStreetMap Nominatim has a rate limit of 1 request per second.
             For bulk geocoding, add delays between requests or use Google Maps API.
         """
+        key = self._cache_key(address)
+        cached = geocode_cache.get(None, key)
+        if cached:
+            return cached
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._lookup(address, retry_count))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the shared lookup
+        result = await asyncio.shield(pending)
+        if result:
+            # Failures are not cached, so a transient error is retried next time
+            geocode_cache.set(None, key, result)
+
+        return result
+
+    async def _lookup(
+        self,
+        address: str,
+        retry_count: int
+    ) -> Optional[Tuple[float, float]]:
+        """Geocode an address with the provider, retrying on timeout."""
         for attempt in range(retry_count):
             try:
                 # Run geocoding in thread pool to avoid blocking
@@ -97,6 +220,38 @@ class GeocodingService:
 
         return None
 
+    async def geocode_addresses(
+        self,
+        *addresses: Optional[str]
+    ) -> List[Optional[Tuple[float, float]]]:
+        """
+        Geocode several independent addresses concurrently.
+
+        Duplicate addresses are only looked up once, and None entries are
+        skipped, so callers can pass optional addresses positionally.
+        Lookups are bounded by max_concurrency, so with Nominatim they run
+        one at a time.
+
+        Args:
+            addresses: Street addresses to geocode (None to skip)
+
+        Returns:
+            List of (latitude, longitude) tuples or None, in argument order
+        """
+        unique_addresses = list(dict.fromkeys(a for a in addresses if a))
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def geocode_one(address: str) -> Optional[Tuple[float, float]]:
+            async with semaphore:
+                return await self.geocode_address(address)
+
+        results = await asyncio.gather(
+            *(geocode_one(address) for address in unique_addresses)
+        )
+        coordinates = dict(zip(unique_addresses, results))
+
+        return [coordinates.get(address) if address else None for address in addresses]
+
     async def geocode_with_rate_limit(
         self,
         address: str,
@@ -115,12 +270,61 @@ class GeocodingService:
         Returns:
             Tuple of (latitude, longitude) or None if geocoding fails
         """
+        # Cached addresses don't reach the provider, so need no delay
+        cached = self.get_cached(address)
+        if cached:
+            return cached
+
         if not settings.google_maps_api_key:
             # Only apply delay for OpenStreetMap (rate limited)
             await asyncio.sleep(delay_seconds)
 
         return await self.geocode_address(address)
 
+    async def geocode_many_as_completed(
+        self,
+        addresses: List[str]
+    ) -> AsyncIterator[List[Tuple[int, Union[Optional[Tuple[float, float]], BaseException]]]]:
+        """
+        Geocode many addresses concurrently, yielding results as they finish.
+
+        Lookups are bounded by max_concurrency and go through
+        geocode_with_rate_limit, so with Nominatim (max_concurrency of 1)
+        requests stay one per second. Each yielded batch holds every lookup
+        that finished since the previous one.
+
+        Args:
+            addresses: Street addresses to geocode
+
+        Yields:
+            Lists of (index into addresses, result) where result is
+            (latitude, longitude), None if not found, or the exception
+            raised by that lookup
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def geocode_one(address: str) -> Optional[Tuple[float, float]]:
+            async with semaphore:
+                return await self.geocode_with_rate_limit(address)
+
+        indices = {
+            asyncio.ensure_future(geocode_one(address)): index
+            for index, address in enumerate(addresses)
+        }
+        pending = set(indices)
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                yield [
+                    (indices[task], task.exception() or task.result())
+                    for task in done
+                ]
+        finally:
+            # The consumer stopped early (e.g. client disconnected)
+            for task in pending:
+                task.cancel()
+
 
 # Global geocoding service instance
 geocoding_service = GeocodingService()
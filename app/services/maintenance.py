@@ -0,0 +1,64 @@
+"""
+Background maintenance service.
+Runs periodic housekeeping tasks (e.g. pruning expired temporary assignments)
+outside the request path.
+"""
+
+from sqlalchemy import delete
+from datetime import date, timedelta
+import logging
+import asyncio
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.temp_assignment import TempTechAssignment
+
+logger = logging.getLogger(__name__)
+
+
+class MaintenanceService:
+    """Service for periodic database housekeeping."""
+
+    async def cleanup_old_temp_assignments(self) -> int:
+        """
+        Delete temporary tech assignments older than the retention window.
+
+        Uses its own session so it never shares a transaction with a request.
+
+        Returns:
+            int: Number of assignments deleted
+        """
+        cutoff_date = date.today() - timedelta(days=settings.temp_assignment_retention_days)
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                delete(TempTechAssignment).where(
+                    TempTechAssignment.assignment_date < cutoff_date
+                )
+            )
+            await session.commit()
+
+        return result.rowcount
+
+    async def run_periodic_cleanup(self) -> None:
+        """
+        Run cleanup tasks forever, once per configured interval.
+
+        Failures are logged and retried on the next interval; cancel the task
+        to stop the loop.
+        """
+        interval = settings.temp_assignment_cleanup_interval_seconds
+
+        while True:
+            try:
+                deleted = await self.cleanup_old_temp_assignments()
+                if deleted:
+                    logger.info("Deleted %d expired temp tech assignments", deleted)
+            except Exception:
+                logger.exception("Temp assignment cleanup failed")
+
+            await asyncio.sleep(interval)
+
+
+# Global maintenance service instance
+maintenance_service = MaintenanceService()
@@ -8,15 +8,19 @@ from ortools.constraint_solver import pywrapcp
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, time, timedelta
 import logging
-import math
+import numpy as np
 
 from app.models.customer import Customer
 from app.models.tech import Tech
 from app.config import settings
 from app.services.routing import routing_service
+from app.services.geocoding import haversine_miles
 
 logger = logging.getLogger(__name__)
 
+# Maximum route duration in minutes (matches the OR-Tools time dimension)
+MAX_ROUTE_DURATION_MINUTES = 480
+
 
 class RouteOptimizationService:
     """Service for optimizing routes using Google OR-Tools VRP solver."""
@@ -25,37 +29,6 @@ class RouteOptimizationService:
         """Initialize optimization service."""
         self.time_limit_seconds = settings.optimization_time_limit_seconds
 
-    def _calculate_distance(
-        self,
-        lat1: float,
-        lon1: float,
-        lat2: float,
-        lon2: float
-    ) -> float:
-        """
-        Calculate Haversine distance between two GPS coordinates in miles.
-
-        Args:
-            lat1, lon1: First location coordinates
-            lat2, lon2: Second location coordinates
-
-        Returns:
-            Distance in miles
-        """
-        R = 3959  # Earth radius in miles
-
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
-
-        a = (math.sin(delta_lat / 2) ** 2 +
-             math.cos(lat1_rad) * math.cos(lat2_rad) *
-             math.sin(delta_lon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-        return R * c
-
     def _create_distance_matrix(
         self,
         locations: List[Tuple[float, float]]
@@ -69,20 +42,15 @@ class RouteOptimizationService:
         Returns:
             Matrix of distances in meters (for OR-Tools)
         """
-        num_locations = len(locations)
-        distance_matrix = [[0] * num_locations for _ in range(num_locations)]
-
-        for i in range(num_locations):
-            for j in range(num_locations):
-                if i != j:
-                    distance_miles = self._calculate_distance(
-                        locations[i][0], locations[i][1],
-                        locations[j][0], locations[j][1]
-                    )
-                    # Convert to meters and round to integer
-                    distance_matrix[i][j] = int(distance_miles * 1609.34)
+        if not locations:
+            return []
+
+        # Haversine for every pair at once; the diagonal comes out as 0
+        lats, lons = np.asarray(locations, dtype=np.float64).T
+        distances_miles = haversine_miles(lats[:, None], lons[:, None], lats[None, :], lons[None, :])
 
-        return distance_matrix
+        # Convert to meters and round to integer
+        return (distances_miles * 1609.34).astype(np.int64).tolist()
 
     def _create_time_matrix(
         self,
@@ -99,17 +67,44 @@ class RouteOptimizationService:
         Returns:
             Matrix of travel times in minutes
         """
-        num_locations = len(distance_matrix)
-        time_matrix = [[0] * num_locations for _ in range(num_locations)]
+        if not distance_matrix:
+            return []
 
-        for i in range(num_locations):
-            for j in range(num_locations):
-                # Convert meters to miles, divide by speed, convert to minutes
-                distance_miles = distance_matrix[i][j] / 1609.34
-                time_hours = distance_miles / avg_speed_mph
-                time_matrix[i][j] = int(time_hours * 60)
+        # Convert meters to miles, divide by speed, convert to minutes
+        distance_miles = np.asarray(distance_matrix, dtype=np.float64) / 1609.34
+        time_hours = distance_miles / avg_speed_mph
+        return (time_hours * 60).astype(np.int64).tolist()
 
-        return time_matrix
+    def _create_transit_time_matrix(
+        self,
+        time_matrix: List[List[int]],
+        customers: List[Customer],
+        customer_start_idx: int
+    ) -> List[List[int]]:
+        """
+        Add each customer's service duration to every arc arriving at it.
+
+        The OR-Tools time callback runs for every arc the solver evaluates,
+        so it should be a single lookup rather than a customer attribute read.
+
+        Args:
+            time_matrix: Matrix of travel times in minutes
+            customers: Customers in location order
+            customer_start_idx: Index where customer locations start
+
+        Returns:
+            Matrix of travel plus service times in minutes
+        """
+        if not time_matrix:
+            return []
+
+        service_times = np.zeros(len(time_matrix), dtype=np.int64)
+        service_times[customer_start_idx:] = np.fromiter(
+            (customer.base_service_duration for customer in customers),
+            dtype=np.int64,
+            count=len(customers)
+        )
+        return (np.asarray(time_matrix) + service_times[None, :]).tolist()
 
     def _customer_services_on_day(self, customer: Customer, service_day: str) -> bool:
         """
@@ -212,6 +207,7 @@ class RouteOptimizationService:
 
             # Get distance and time matrices from routing service
             distance_matrix, time_matrix = await routing_service.get_distance_matrix(locations)
+            transit_time_matrix = self._create_transit_time_matrix(time_matrix, valid_customers, 1)
 
             # Create routing model for single tech
             manager = pywrapcp.RoutingIndexManager(
@@ -230,18 +226,11 @@ class RouteOptimizationService:
             transit_callback_index = routing.RegisterTransitCallback(distance_callback)
             routing.SetArcCostEvaluatorOfAllVehicles(transit_callback_index)
 
-            # Time callback
+            # Time callback (travel plus service time at the destination)
             def time_callback(from_index, to_index):
                 from_node = manager.IndexToNode(from_index)
                 to_node = manager.IndexToNode(to_index)
-                travel_time = time_matrix[from_node][to_node]
-
-                service_time = 0
-                if to_node > 0:
-                    customer = valid_customers[to_node - 1]
-                    service_time = customer.base_service_duration
-
-                return travel_time + service_time
+                return transit_time_matrix[from_node][to_node]
 
             time_callback_index = routing.RegisterTransitCallback(time_callback)
 
@@ -757,20 +746,13 @@ class RouteOptimizationService:
         transit_callback_index = routing.RegisterTransitCallback(distance_callback)
         routing.SetArcCostEvaluatorOfAllVehicles(transit_callback_index)
 
-        # Add time dimension with service duration
+        # Add time dimension with service duration (customer nodes only)
+        transit_time_matrix = self._create_transit_time_matrix(time_matrix, customers, customer_start_idx)
+
         def time_callback(from_index, to_index):
             from_node = manager.IndexToNode(from_index)
             to_node = manager.IndexToNode(to_index)
-            travel_time = time_matrix[from_node][to_node]
-
-            # Add service time if this is a customer node (not depot)
-            service_time = 0
-            if to_node >= customer_start_idx:  # Customer node
-                customer_idx = to_node - customer_start_idx
-                customer = customers[customer_idx]
-                service_time = customer.base_service_duration
-
-            return travel_time + service_time
+            return transit_time_matrix[from_node][to_node]
 
         time_callback_index = routing.RegisterTransitCallback(time_callback)
 
@@ -974,6 +956,106 @@ class RouteOptimizationService:
 
         return routes, total_distance, total_duration
 
+    def _greedy_single_tech_route(
+        self,
+        distance_matrix: List[List[int]],
+        time_matrix: List[List[int]],
+        tech: Tech,
+        customers: List[Customer],
+        start_idx: int,
+        end_idx: int,
+        customer_start_idx: int,
+        service_day: Optional[str]
+    ) -> Optional[Dict]:
+        """
+        Build a nearest-neighbor route for a single tech without OR-Tools.
+
+        Args:
+            distance_matrix: Distance matrix in meters
+            time_matrix: Time matrix in minutes
+            tech: The only tech being routed
+            customers: Customers with valid coordinates
+            start_idx: Location index of the tech's start depot
+            end_idx: Location index of the tech's end depot
+            customer_start_idx: Index where customer locations start
+            service_day: Service day being optimized
+
+        Returns:
+            Dict in the same shape as _optimize_single_day, or None if the
+            route would exceed the tech's capacity or the maximum route
+            duration (so the solver can report it instead)
+        """
+        capacity = int(tech.max_customers_per_day * tech.efficiency_multiplier)
+        if len(customers) > capacity:
+            return None
+
+        remaining = set(range(customer_start_idx, customer_start_idx + len(customers)))
+        current = start_idx
+        route_distance = 0
+        route_duration = 0
+        route_customers = []
+
+        while remaining:
+            next_node = min(remaining, key=lambda node: distance_matrix[current][node])
+            remaining.remove(next_node)
+
+            customer = customers[next_node - customer_start_idx]
+            route_distance += distance_matrix[current][next_node]
+            route_duration += time_matrix[current][next_node] + customer.base_service_duration
+            route_customers.append({
+                "customer_id": str(customer.id),
+                "customer_name": customer.display_name or customer.name or "Unknown",
+                "address": customer.address,
+                "latitude": customer.latitude,
+                "longitude": customer.longitude,
+                "service_duration": customer.base_service_duration,
+                "sequence": len(route_customers) + 1
+            })
+            current = next_node
+
+        route_distance += distance_matrix[current][end_idx]
+        route_duration += time_matrix[current][end_idx]
+
+        if route_duration > MAX_ROUTE_DURATION_MINUTES:
+            return None
+
+        route_distance_miles = route_distance / 1609.34
+
+        logger.info(
+            "Greedy route for %s: %d stops, total_distance=%dm (%.1fmi)",
+            tech.name, len(route_customers), route_distance, route_distance_miles
+        )
+
+        return {
+            "routes": [{
+                "driver_id": str(tech.id),
+                "driver_name": tech.name,
+                "driver_color": tech.color if hasattr(tech, 'color') else '#3498db',
+                "service_day": service_day or "multiple",
+                "start_location": {
+                    "address": tech.start_location_address,
+                    "latitude": tech.start_latitude,
+                    "longitude": tech.start_longitude
+                },
+                "end_location": {
+                    "address": tech.end_location_address,
+                    "latitude": tech.end_latitude,
+                    "longitude": tech.end_longitude
+                },
+                "stops": route_customers,
+                "total_customers": len(route_customers),
+                "total_distance_miles": round(route_distance_miles, 2),
+                "total_duration_minutes": route_duration
+            }],
+            "summary": {
+                "total_routes": 1,
+                "total_customers": len(customers),
+                "total_distance_miles": round(route_distance_miles, 2),
+                "total_duration_minutes": route_duration,
+                "optimization_time_seconds": 0
+            }
+        }
+
     async def _optimize_single_day(
         self,
         customers: List[Customer],
@@ -1009,6 +1091,21 @@ class RouteOptimizationService:
         # Get distance and time matrices from routing service
         distance_matrix, time_matrix = await routing_service.get_distance_matrix(locations)
 
+        # Trivial case: one tech with a handful of stops doesn't need the VRP solver
+        if len(techs) == 1 and len(valid_customers) <= settings.greedy_route_max_customers:
+            greedy_result = self._greedy_single_tech_route(
+                distance_matrix,
+                time_matrix,
+                techs[0],
+                valid_customers,
+                start_indices[0],
+                end_indices[0],
+                customer_start_idx,
+                service_day
+            )
+            if greedy_result:
+                return greedy_result
+
         # Debug: Log sample distances to verify units
         if len(distance_matrix) > 2:
             logger.info(f"Sample distances: depot0->depot1={distance_matrix[0][1]}m, depot0->customer0={distance_matrix[0][customer_start_idx]}m")
@@ -11,11 +11,18 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from io import BytesIO
 from datetime import datetime
-from typing import List, Dict
+from tempfile import SpooledTemporaryFile
+from typing import List, Dict, Iterator, BinaryIO
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Chunk size for streamed PDF output
+PDF_STREAM_CHUNK_SIZE = 64 * 1024
+
+# PDFs larger than this spill from memory to a temp file while streaming
+PDF_SPOOL_MAX_SIZE = 1024 * 1024
+
 
 class PDFExportService:
     """Service for generating PDF route sheets."""
@@ -191,8 +198,47 @@ class PDFExportService:
             BytesIO buffer containing the PDF
         """
         buffer = BytesIO()
+        self._build_multi_route_pdf(buffer, routes, techs)
+        buffer.seek(0)
+        return buffer
+
+    def stream_multi_route_pdf(
+        self,
+        routes: List[Dict],
+        techs: Dict[str, Dict]
+    ) -> Iterator[bytes]:
+        """
+        Generate a multi-route PDF and yield it in fixed-size chunks.
+
+        ReportLab writes the cross-reference table only once the whole
+        document is built, so pages cannot be flushed individually. The PDF
+        is built into a spooled temp file instead (kept in memory while small,
+        moved to disk once large) and streamed out chunk by chunk. Being a
+        sync generator, StreamingResponse runs it in the threadpool so the
+        build does not block the event loop.
+
+        Args:
+            routes: List of route data
+            techs: Dictionary mapping tech_id to tech info
+
+        Yields:
+            PDF bytes in chunks of PDF_STREAM_CHUNK_SIZE
+        """
+        with SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE) as spool:
+            self._build_multi_route_pdf(spool, routes, techs)
+            spool.seek(0)
+            while chunk := spool.read(PDF_STREAM_CHUNK_SIZE):
+                yield chunk
+
+    def _build_multi_route_pdf(
+        self,
+        target: BinaryIO,
+        routes: List[Dict],
+        techs: Dict[str, Dict]
+    ) -> None:
+        """Build a multi-route PDF (one page per route) into a file-like target."""
         doc = SimpleDocTemplate(
-            buffer,
+            target,
             pagesize=letter,
             rightMargin=0.5*inch,
             leftMargin=0.5*inch,
@@ -216,8 +262,6 @@ class PDFExportService:
 
         # Build PDF
         doc.build(story)
-        buffer.seek(0)
-        return buffer
 
     def _build_route_page(self, route_data: Dict, tech_info: Dict) -> List:
         """Build story elements for a single route page."""
@@ -8,8 +8,9 @@ from typing import List, Tuple, Dict, Optional
 import logging
 import asyncio
 import aiohttp
-import math
+import numpy as np
 from app.config import settings
+from app.services.geocoding import haversine_miles
 
 logger = logging.getLogger(__name__)
 
@@ -33,38 +34,6 @@ class RoutingProvider(ABC):
         """
         pass
 
-    def _haversine_distance(
-        self,
-        lat1: float,
-        lon1: float,
-        lat2: float,
-        lon2: float
-    ) -> float:
-        """
-        Calculate straight-line distance between two GPS coordinates in miles.
-        Used as fallback when routing API fails.
-
-        Args:
-            lat1, lon1: First location coordinates
-            lat2, lon2: Second location coordinates
-
-        Returns:
-            Distance in miles
-        """
-        R = 3959  # Earth radius in miles
-
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
-
-        a = (math.sin(delta_lat / 2) ** 2 +
-             math.cos(lat1_rad) * math.cos(lat2_rad) *
-             math.sin(delta_lon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-        return R * c
-
     def _create_fallback_matrices(
         self,
         locations: List[Tuple[float, float]]
@@ -79,25 +48,18 @@ class RoutingProvider(ABC):
         Returns:
             Tuple of (distance_matrix in meters, time_matrix in minutes)
         """
-        num_locations = len(locations)
-        distance_matrix = [[0] * num_locations for _ in range(num_locations)]
-        time_matrix = [[0] * num_locations for _ in range(num_locations)]
+        if not locations:
+            return [], []
 
         avg_speed_mph = 30.0
 
-        for i in range(num_locations):
-            for j in range(num_locations):
-                if i != j:
-                    distance_miles = self._haversine_distance(
-                        locations[i][0], locations[i][1],
-                        locations[j][0], locations[j][1]
-                    )
-                    # Convert to meters
-                    distance_matrix[i][j] = int(distance_miles * 1609.34)
+        # Haversine for every pair at once; the diagonal comes out as 0
+        lats, lons = np.asarray(locations, dtype=np.float64).T
+        distances_miles = haversine_miles(lats[:, None], lons[:, None], lats[None, :], lons[None, :])
 
-                    # Calculate time in minutes
-                    time_hours = distance_miles / avg_speed_mph
-                    time_matrix[i][j] = int(time_hours * 60)
+        # Convert to meters, and to travel time in minutes
+        distance_matrix = (distances_miles * 1609.34).astype(np.int64).tolist()
+        time_matrix = (distances_miles / avg_speed_mph * 60).astype(np.int64).tolist()
 
         return distance_matrix, time_matrix
 
@@ -1,12 +1,12 @@
 """
 Single-tech route generation service.
 Creates optimized stop sequences for individual techs using TSP (Traveling Salesman Problem).
-Auto-creates Visit records for each stop in the route.
+Visit records for each stop are created once a route is stored.
 """
 
 from ortools.constraint_solver import routing_enums_pb2
 from ortools.constraint_solver import pywrapcp
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple
 from datetime import datetime, date, time, timedelta
 from uuid import UUID
 import logging
@@ -29,12 +29,14 @@ class TechRoutingService:
         customers: List[Customer],
         service_day: str,
         route_date: date,
-        organization_id: UUID,
-        db_session: Optional[any] = None
+        organization_id: UUID
     ) -> TechRoute:
         """
         Generate an optimized route for a single tech and their customers.
 
+        Visits are not created here; call create_visits_for_route once the
+        route has been stored.
+
         Args:
             tech: Tech to route
             customers: List of customers assigned to this tech
@@ -125,20 +127,39 @@ class TechRoutingService:
             f"{solution['total_distance']:.1f} miles, {solution['total_duration']} minutes"
         )
 
-        # Auto-create Visit records for each stop if db_session provided
-        if db_session:
-            await self._create_visits_for_route(
-                tech=tech,
-                customers=customers,
-                stop_sequence=solution['stop_sequence'],
-                service_day=service_day,
-                route_date=route_date,
-                organization_id=organization_id,
-                db_session=db_session
-            )
-
         return tech_route
 
+    async def create_visits_for_route(
+        self,
+        tech_route: TechRoute,
+        tech: Tech,
+        customers: List[Customer],
+        db_session: any
+    ):
+        """
+        Auto-create Visit records for a route that has been stored.
+
+        Every stop gets a visit, whether the route was optimized, has a
+        single stop, or fell back to the original order. Callers that insert
+        routes with ON CONFLICT DO NOTHING use this after the insert, so only
+        the request whose route was stored writes visits.
+
+        Args:
+            tech_route: Stored route whose stops get visits
+            tech: Tech performing the route
+            customers: List of customers on the route
+            db_session: SQLAlchemy async session
+        """
+        await self._create_visits_for_route(
+            tech=tech,
+            customers=customers,
+            stop_sequence=tech_route.stop_sequence,
+            service_day=tech_route.service_day,
+            route_date=tech_route.route_date,
+            organization_id=tech_route.organization_id,
+            db_session=db_session
+        )
+
     async def _create_visits_for_route(
         self,
         tech: Tech,
@@ -200,8 +221,8 @@ class TechRoutingService:
             # Increment time for next stop (add service duration + travel time estimate)
             current_time = current_time + timedelta(minutes=customer.visit_duration + 10)  # +10 min travel estimate
 
-        # Commit visits
-        await db_session.commit()
+        # Flush visits; the caller commits them together with the route
+        await db_session.flush()
         logger.info(f"Created {len(stop_sequence)} visit records for {tech.name} on {route_date}")
 
     def _solve_tsp(
@@ -0,0 +1,66 @@
+"""Store tech route stop sequences as packed 16-byte ids
+
+Revision ID: a4b8d2e7f913
+Revises: f39c7d4e6a81
+Create Date: 2025-11-05 17:51:03.287416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4b8d2e7f913'
+down_revision: Union[str, None] = 'f39c7d4e6a81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ALTER COLUMN ... USING cannot contain a subquery, so convert through a
+    # new column
+    op.add_column('tech_routes', sa.Column('stop_sequence_packed', sa.LargeBinary(), nullable=True))
+    op.execute("""
+        UPDATE tech_routes SET stop_sequence_packed = (
+            SELECT coalesce(
+                string_agg(decode(replace(customer_id, '-', ''), 'hex'), ''::bytea ORDER BY position),
+                ''::bytea
+            )
+            FROM jsonb_array_elements_text(stop_sequence) WITH ORDINALITY AS stops(customer_id, position)
+        )
+    """)
+    op.drop_column('tech_routes', 'stop_sequence')
+    op.alter_column(
+        'tech_routes',
+        'stop_sequence_packed',
+        new_column_name='stop_sequence',
+        nullable=False,
+        comment='Ordered customer IDs, 16 bytes each'
+    )
+
+
+def downgrade() -> None:
+    op.add_column(
+        'tech_routes',
+        sa.Column('stop_sequence_json', postgresql.JSONB(astext_type=sa.Text()), nullable=True)
+    )
+    op.execute("""
+        UPDATE tech_routes SET stop_sequence_json = (
+            SELECT coalesce(
+                jsonb_agg(encode(substring(stop_sequence FROM position * 16 + 1 FOR 16), 'hex')::uuid::text ORDER BY position),
+                '[]'::jsonb
+            )
+            FROM generate_series(0, length(stop_sequence) / 16 - 1) AS position
+        )
+    """)
+    op.drop_column('tech_routes', 'stop_sequence')
+    op.alter_column(
+        'tech_routes',
+        'stop_sequence_json',
+        new_column_name='stop_sequence',
+        nullable=False,
+        comment='Ordered array of customer IDs'
+    )
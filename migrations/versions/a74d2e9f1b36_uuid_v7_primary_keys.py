@@ -0,0 +1,60 @@
+"""Generate time-ordered UUIDv7 primary keys
+
+Revision ID: a74d2e9f1b36
+Revises: f63c9e4b5d28
+Create Date: 2025-11-05 15:20:44.730916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.database import GEN_UUID_V7_SQL
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a74d2e9f1b36'
+down_revision: Union[str, None] = 'f63c9e4b5d28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose id defaults to gen_uuid_v7(), with the server default to
+# restore on downgrade
+UUID_V7_TABLES = {
+    'customers': 'gen_random_uuid()',
+    'organizations': 'gen_random_uuid()',
+    'organization_users': None,
+    'techs': None,
+    'routes': None,
+    'route_stops': None,
+    'tech_routes': None,
+    'issues': None,
+}
+
+
+def upgrade() -> None:
+    op.execute(GEN_UUID_V7_SQL)
+
+    for table in UUID_V7_TABLES:
+        op.alter_column(
+            table,
+            'id',
+            server_default=sa.text('gen_uuid_v7()'),
+            existing_type=sa.UUID(),
+            existing_nullable=False
+        )
+
+
+def downgrade() -> None:
+    for table, server_default in UUID_V7_TABLES.items():
+        op.alter_column(
+            table,
+            'id',
+            server_default=sa.text(server_default) if server_default else None,
+            existing_type=sa.UUID(),
+            existing_nullable=False
+        )
+
+    op.execute('DROP FUNCTION gen_uuid_v7()')
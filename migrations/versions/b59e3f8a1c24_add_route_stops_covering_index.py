@@ -0,0 +1,37 @@
+"""Add a covering route_stops index for route rendering
+
+Revision ID: b59e3f8a1c24
+Revises: a4b8d2e7f913
+Create Date: 2025-11-05 18:09:47.530628
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b59e3f8a1c24'
+down_revision: Union[str, None] = 'a4b8d2e7f913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The stop queries filter route_id, order by sequence and read only
+    # customer_id and estimated_service_duration from route_stops
+    op.create_index(
+        'ix_route_stops_route_covering',
+        'route_stops',
+        ['route_id', 'sequence'],
+        unique=False,
+        postgresql_include=['customer_id', 'estimated_service_duration']
+    )
+    # route_id leads the covering index, which also serves the cascade deletes
+    op.drop_index('ix_route_stops_route_id', table_name='route_stops')
+
+
+def downgrade() -> None:
+    op.create_index('ix_route_stops_route_id', 'route_stops', ['route_id'], unique=False)
+    op.drop_index('ix_route_stops_route_covering', table_name='route_stops')
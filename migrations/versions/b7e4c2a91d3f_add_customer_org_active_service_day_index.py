@@ -0,0 +1,32 @@
+"""Add customer org/active/service_day index
+
+Revision ID: b7e4c2a91d3f
+Revises: abd3df5a3c9f
+Create Date: 2025-11-05 09:12:41.530218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c2a91d3f'
+down_revision: Union[str, None] = 'abd3df5a3c9f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Backs the per-day active customer lookups used by route generation
+    op.create_index(
+        'ix_customers_org_active_service_day',
+        'customers',
+        ['organization_id', 'is_active', 'service_day'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_customers_org_active_service_day', table_name='customers')
@@ -0,0 +1,51 @@
+"""Add organization-scoped status and route day indexes
+
+Revision ID: b85e3f0a2c47
+Revises: a74d2e9f1b36
+Create Date: 2025-11-05 15:48:09.362158
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b85e3f0a2c47'
+down_revision: Union[str, None] = 'a74d2e9f1b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The customer and issue lists always filter by organization and
+    # optionally by status
+    op.create_index(
+        'ix_customers_org_status',
+        'customers',
+        ['organization_id', 'status'],
+        unique=False
+    )
+    op.create_index(
+        'ix_issues_org_status',
+        'issues',
+        ['organization_id', 'status'],
+        unique=False
+    )
+    # Per-day route lookups now filter routes.organization_id directly; the
+    # composite index replaces the service_day index
+    op.create_index(
+        'ix_routes_org_day_tech',
+        'routes',
+        ['organization_id', 'service_day', 'tech_id'],
+        unique=False
+    )
+    op.drop_index('ix_routes_service_day', table_name='routes')
+
+
+def downgrade() -> None:
+    op.create_index('ix_routes_service_day', 'routes', ['service_day'], unique=False)
+    op.drop_index('ix_routes_org_day_tech', table_name='routes')
+    op.drop_index('ix_issues_org_status', table_name='issues')
+    op.drop_index('ix_customers_org_status', table_name='customers')
@@ -0,0 +1,40 @@
+"""Add org/service_day/date indexes for tech routes and temp assignments
+
+Revision ID: c3d9f1e5a7b2
+Revises: b7e4c2a91d3f
+Create Date: 2025-11-05 10:03:17.284915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d9f1e5a7b2'
+down_revision: Union[str, None] = 'b7e4c2a91d3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Backs the per-day tech routes lookup run on every map render
+    op.create_index(
+        'ix_tech_routes_org_day_date',
+        'tech_routes',
+        ['organization_id', 'service_day', 'route_date'],
+        unique=False
+    )
+    # Backs the per-day temp assignment lookups during route generation
+    op.create_index(
+        'ix_temp_assignments_org_day_date',
+        'temp_tech_assignments',
+        ['organization_id', 'service_day', 'assignment_date'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_temp_assignments_org_day_date', table_name='temp_tech_assignments')
+    op.drop_index('ix_tech_routes_org_day_date', table_name='tech_routes')
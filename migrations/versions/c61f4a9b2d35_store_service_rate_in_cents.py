@@ -0,0 +1,46 @@
+"""Store customer service rates as integer cents
+
+Revision ID: c61f4a9b2d35
+Revises: b59e3f8a1c24
+Create Date: 2025-11-05 18:31:12.846059
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c61f4a9b2d35'
+down_revision: Union[str, None] = 'b59e3f8a1c24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'customers',
+        sa.Column(
+            'service_rate_cents',
+            sa.Integer(),
+            nullable=True,
+            comment='Service rate in cents (e.g., 12500 for $125)'
+        )
+    )
+    op.execute('UPDATE customers SET service_rate_cents = round(service_rate * 100)::integer')
+    op.drop_column('customers', 'service_rate')
+
+
+def downgrade() -> None:
+    op.add_column(
+        'customers',
+        sa.Column(
+            'service_rate',
+            sa.Numeric(10, 2),
+            nullable=True,
+            comment='Service rate amount (e.g., 125.00 for $125)'
+        )
+    )
+    op.execute('UPDATE customers SET service_rate = service_rate_cents / 100.0')
+    op.drop_column('customers', 'service_rate_cents')
@@ -0,0 +1,37 @@
+"""Store customer base service duration as a generated column
+
+Revision ID: c96f4a1b3d58
+Revises: b85e3f0a2c47
+Create Date: 2025-11-05 16:12:55.904713
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c96f4a1b3d58'
+down_revision: Union[str, None] = 'b85e3f0a2c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Computed by Postgres on every write; existing rows are filled in as the
+    # table is rewritten
+    op.add_column(
+        'customers',
+        sa.Column(
+            'base_service_duration',
+            sa.Integer(),
+            sa.Computed('visit_duration + (difficulty - 1) * 5', persisted=True),
+            nullable=False,
+            comment='Service duration in minutes used by route optimization'
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('customers', 'base_service_duration')
@@ -0,0 +1,50 @@
+"""Index only active customers and techs for the per-day lookups
+
+Revision ID: d17a5b2c4e69
+Revises: c96f4a1b3d58
+Create Date: 2025-11-05 16:37:21.148302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd17a5b2c4e69'
+down_revision: Union[str, None] = 'c96f4a1b3d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The per-day customer queries (route building, the map) all filter
+    # is_active = true, so a partial index over active rows replaces the
+    # full one
+    op.create_index(
+        'ix_customers_active_org_day',
+        'customers',
+        ['organization_id', 'service_day'],
+        unique=False,
+        postgresql_where=sa.text('is_active = true')
+    )
+    op.drop_index('ix_customers_org_active_service_day', table_name='customers')
+    op.create_index(
+        'ix_techs_active_org_name',
+        'techs',
+        ['organization_id', 'name'],
+        unique=False,
+        postgresql_where=sa.text('is_active = true')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_techs_active_org_name', table_name='techs')
+    op.create_index(
+        'ix_customers_org_active_service_day',
+        'customers',
+        ['organization_id', 'is_active', 'service_day'],
+        unique=False
+    )
+    op.drop_index('ix_customers_active_org_day', table_name='customers')
@@ -0,0 +1,54 @@
+"""Add composite indexes for visit list filters
+
+Revision ID: d41a7e6c2f90
+Revises: c3d9f1e5a7b2
+Create Date: 2025-11-05 11:26:54.913402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a7e6c2f90'
+down_revision: Union[str, None] = 'c3d9f1e5a7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # list_visits always filters by organization and orders by scheduled_date;
+    # these cover the common optional tech/customer/status filters
+    op.create_index(
+        'ix_visits_org_scheduled',
+        'visits',
+        ['organization_id', 'scheduled_date'],
+        unique=False
+    )
+    op.create_index(
+        'ix_visits_org_tech_scheduled',
+        'visits',
+        ['organization_id', 'tech_id', 'scheduled_date'],
+        unique=False
+    )
+    op.create_index(
+        'ix_visits_org_customer_scheduled',
+        'visits',
+        ['organization_id', 'customer_id', 'scheduled_date'],
+        unique=False
+    )
+    op.create_index(
+        'ix_visits_org_status',
+        'visits',
+        ['organization_id', 'status'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_visits_org_status', table_name='visits')
+    op.drop_index('ix_visits_org_customer_scheduled', table_name='visits')
+    op.drop_index('ix_visits_org_tech_scheduled', table_name='visits')
+    op.drop_index('ix_visits_org_scheduled', table_name='visits')
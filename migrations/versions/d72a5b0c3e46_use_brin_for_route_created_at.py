@@ -0,0 +1,35 @@
+"""Replace the routes created_at B-tree index with BRIN
+
+Revision ID: d72a5b0c3e46
+Revises: c61f4a9b2d35
+Create Date: 2025-11-05 18:52:38.109574
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd72a5b0c3e46'
+down_revision: Union[str, None] = 'c61f4a9b2d35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_routes_created_brin',
+        'routes',
+        ['created_at'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+    op.drop_index('ix_routes_created_at', table_name='routes')
+
+
+def downgrade() -> None:
+    op.create_index('ix_routes_created_at', 'routes', ['created_at'], unique=False)
+    op.drop_index('ix_routes_created_brin', table_name='routes')
@@ -0,0 +1,43 @@
+"""Store issue and visit photos as JSONB
+
+Revision ID: e28b6c3d5f70
+Revises: d17a5b2c4e69
+Create Date: 2025-11-05 16:58:40.613275
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e28b6c3d5f70'
+down_revision: Union[str, None] = 'd17a5b2c4e69'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ('issues', 'visits'):
+        op.alter_column(
+            table,
+            'photos',
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using='photos::jsonb'
+        )
+
+
+def downgrade() -> None:
+    for table in ('issues', 'visits'):
+        op.alter_column(
+            table,
+            'photos',
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using='photos::json'
+        )
@@ -0,0 +1,43 @@
+"""Generate customer ids in the database and drop the redundant id index
+
+Revision ID: e52b8d3a4c17
+Revises: d41a7e6c2f90
+Create Date: 2025-11-05 14:02:31.518207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e52b8d3a4c17'
+down_revision: Union[str, None] = 'd41a7e6c2f90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from PostgreSQL 13 (organizations already
+    # uses it as a server default)
+    op.alter_column(
+        'customers',
+        'id',
+        server_default=sa.text('gen_random_uuid()'),
+        existing_type=sa.UUID(),
+        existing_nullable=False
+    )
+    # customers_pkey already indexes id
+    op.drop_index('ix_customers_id', table_name='customers')
+
+
+def downgrade() -> None:
+    op.create_index('ix_customers_id', 'customers', ['id'], unique=False)
+    op.alter_column(
+        'customers',
+        'id',
+        server_default=None,
+        existing_type=sa.UUID(),
+        existing_nullable=False
+    )
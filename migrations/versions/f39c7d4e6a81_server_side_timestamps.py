@@ -0,0 +1,69 @@
+"""Set created_at/updated_at in the database
+
+Revision ID: f39c7d4e6a81
+Revises: e28b6c3d5f70
+Create Date: 2025-11-05 17:24:16.352890
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.database import SET_UPDATED_AT_SQL, updated_at_trigger_sql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f39c7d4e6a81'
+down_revision: Union[str, None] = 'e28b6c3d5f70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables with created_at and updated_at, and the server default each
+# timestamp had before (organizations was created with NOW())
+TIMESTAMPED_TABLES = {
+    'customers': None,
+    'issues': None,
+    'organizations': 'NOW()',
+    'organization_users': None,
+    'routes': None,
+    'service_catalog': None,
+    'techs': None,
+    'tech_routes': None,
+}
+
+# The columns hold naive UTC timestamps
+UTC_NOW = "timezone('utc', now())"
+
+
+def _set_default(table: str, column: str, server_default: Union[str, None]) -> None:
+    op.alter_column(
+        table,
+        column,
+        server_default=sa.text(server_default) if server_default else None,
+        existing_type=sa.DateTime()
+    )
+
+
+def upgrade() -> None:
+    op.execute(SET_UPDATED_AT_SQL)
+
+    for table in TIMESTAMPED_TABLES:
+        _set_default(table, 'created_at', UTC_NOW)
+        _set_default(table, 'updated_at', UTC_NOW)
+        op.execute(updated_at_trigger_sql(table))
+
+    # Route stops are never updated, only bulk inserted
+    _set_default('route_stops', 'created_at', UTC_NOW)
+
+
+def downgrade() -> None:
+    _set_default('route_stops', 'created_at', None)
+
+    for table, server_default in TIMESTAMPED_TABLES.items():
+        op.execute(f'DROP TRIGGER set_updated_at ON {table}')
+        _set_default(table, 'updated_at', server_default)
+        _set_default(table, 'created_at', server_default)
+
+    op.execute('DROP FUNCTION set_updated_at()')
@@ -0,0 +1,28 @@
+"""Drop the standalone customer service_day index
+
+Revision ID: f63c9e4b5d28
+Revises: e52b8d3a4c17
+Create Date: 2025-11-05 14:37:09.204611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f63c9e4b5d28'
+down_revision: Union[str, None] = 'e52b8d3a4c17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Every service_day lookup is organization scoped and served by
+    # ix_customers_org_active_service_day
+    op.drop_index('ix_customers_service_day', table_name='customers')
+
+
+def downgrade() -> None:
+    op.create_index('ix_customers_service_day', 'customers', ['service_day'], unique=False)
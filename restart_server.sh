@@ -24,4 +24,4 @@ fi
 echo "Starting server on port 7008..."
 cd /mnt/Projects/quantum-pools
 source venv/bin/activate
-uvicorn app.main:app --reload --port 7008 --host 0.0.0.0
+uvicorn app.main:app --reload --port 7008 --host 0.0.0.0 --loop uvloop --http httptools
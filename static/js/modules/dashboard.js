@@ -20,7 +20,7 @@ async function loadDashboardStats() {
 
         // Load visits count (today's visits)
         const today = new Date().toISOString().split('T')[0];
-        const visitsResp = await fetch(`/api/visits?start_date=${today}&end_date=${today}`, {
+        const visitsResp = await fetch(`/api/visits?start_date=${today}&end_date=${today}&limit=500`, {
             headers: { 'Authorization': `Bearer ${token}` }
         });
         if (visitsResp.ok) {
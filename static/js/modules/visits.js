@@ -184,29 +184,39 @@ function setupEventListeners() {
 }
 
 /**
- * Load visits from API
+ * Load visits from API, following next_cursor until every page is loaded
  */
 async function loadVisits() {
     try {
-        let url = '/api/visits?';
         const params = new URLSearchParams();
 
         if (visitFilters.status) params.append('status', visitFilters.status);
         if (visitFilters.tech_id) params.append('tech_id', visitFilters.tech_id);
         if (visitFilters.customer_id) params.append('customer_id', visitFilters.customer_id);
+        params.append('limit', '500');
 
-        const response = await fetch(url + params.toString(), {
-            headers: { 'Authorization': `Bearer ${Auth.getToken()}` }
-        });
+        const visits = [];
+        let cursor = null;
+        do {
+            if (cursor) params.set('cursor', cursor);
+
+            const response = await fetch('/api/visits?' + params.toString(), {
+                headers: { 'Authorization': `Bearer ${Auth.getToken()}` }
+            });
+
+            if (!response.ok) {
+                console.error('Failed to load visits');
+                showError('Failed to load visits');
+                return;
+            }
 
-        if (response.ok) {
             const data = await response.json();
-            currentVisits = data.visits || [];
-            displayVisits();
-        } else {
-            console.error('Failed to load visits');
-            showError('Failed to load visits');
-        }
+            visits.push(...(data.visits || []));
+            cursor = data.next_cursor;
+        } while (cursor);
+
+        currentVisits = visits;
+        displayVisits();
     } catch (error) {
         console.error('Error loading visits:', error);
         showError('Error loading visits');
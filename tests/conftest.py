@@ -4,6 +4,7 @@ Pytest configuration and fixtures for testing.
 
 import pytest
 import asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from app.database import Base, get_db
 from app.main import app
@@ -39,6 +40,19 @@ async def test_engine():
     await engine.dispose()
 
 
+@pytest.fixture(scope="function")
+def query_log(test_engine):
+    """Record every SQL statement executed on the test engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.fixture(scope="function")
 async def test_db(test_engine):
     """Create a test database session."""
@@ -0,0 +1,90 @@
+"""
+Unit tests for the authentication dependency.
+"""
+
+import pytest
+import hashlib
+import uuid
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from app.dependencies.auth import get_current_user, require_role
+from app.services.cache import auth_cache
+
+
+def make_db(user, organization):
+    """Create a mock session returning one (user, organization) row."""
+    db = Mock()
+    db.execute = AsyncMock(return_value=Mock(one_or_none=Mock(return_value=(user, organization))))
+    return db
+
+
+@pytest.mark.unit
+class TestGetCurrentUser:
+    """Test token validation and the cached active check."""
+
+    @pytest.mark.asyncio
+    async def test_cached_token_skips_database(self):
+        """Test a second request with the same token does not query the database."""
+        organization_id = uuid.uuid4()
+        payload = {
+            "user_id": str(uuid.uuid4()),
+            "organization_id": str(organization_id),
+            "role": "owner",
+            "email": "owner@example.com",
+        }
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token-a")
+        db = make_db(Mock(is_active=True), Mock(is_active=True))
+
+        with patch("app.dependencies.auth.AuthService.decode_token", return_value=payload):
+            first = await get_current_user(credentials, db)
+            second = await get_current_user(credentials, db)
+
+        assert db.execute.await_count == 1
+        assert first.organization_id == second.organization_id == organization_id
+        assert second.user is None
+        auth_cache.invalidate_organization(organization_id)
+
+    @pytest.mark.asyncio
+    async def test_disabled_user_is_not_cached(self):
+        """Test a rejected user is checked again on the next request."""
+        organization_id = uuid.uuid4()
+        payload = {
+            "user_id": str(uuid.uuid4()),
+            "organization_id": str(organization_id),
+            "role": "tech",
+            "email": "tech@example.com",
+        }
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token-b")
+        db = make_db(Mock(is_active=False), Mock(is_active=True))
+
+        with patch("app.dependencies.auth.AuthService.decode_token", return_value=payload):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_current_user(credentials, db)
+
+        assert exc_info.value.status_code == 403
+        token_hash = hashlib.blake2b(b"token-b", digest_size=16).hexdigest()
+        assert auth_cache.get(organization_id, token_hash) is None
+
+
+@pytest.mark.unit
+class TestRequireRole:
+    """Test the role dependency factory."""
+
+    @pytest.mark.asyncio
+    async def test_allows_listed_role(self):
+        """Test a listed role passes through."""
+        auth = Mock(role="admin")
+        checker = require_role("owner", "admin")
+
+        assert await checker(auth) is auth
+
+    @pytest.mark.asyncio
+    async def test_rejects_other_role(self):
+        """Test an unlisted role is rejected with 403."""
+        checker = require_role("owner", "admin")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await checker(Mock(role="tech"))
+
+        assert exc_info.value.status_code == 403
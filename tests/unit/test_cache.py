@@ -0,0 +1,48 @@
+"""
+Unit tests for the in-process response cache.
+"""
+
+import pytest
+import uuid
+from unittest.mock import patch
+from app.services.cache import ResponseCache
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Test TTL expiry and per-organization invalidation."""
+
+    def test_returns_cached_value_until_expiry(self):
+        """Test values are served until their TTL passes."""
+        cache = ResponseCache(ttl_seconds=60)
+        org_id = uuid.uuid4()
+
+        with patch("app.services.cache.time.monotonic", return_value=100.0):
+            cache.set(org_id, "monday", ["route"])
+            assert cache.get(org_id, "monday") == ["route"]
+
+        with patch("app.services.cache.time.monotonic", return_value=161.0):
+            assert cache.get(org_id, "monday") is None
+
+    def test_invalidate_organization_only_clears_that_organization(self):
+        """Test invalidation leaves other organizations' entries alone."""
+        cache = ResponseCache(ttl_seconds=60)
+        org_a, org_b = uuid.uuid4(), uuid.uuid4()
+        cache.set(org_a, "monday", ["a"])
+        cache.set(org_b, "monday", ["b"])
+
+        cache.invalidate_organization(org_a)
+
+        assert cache.get(org_a, "monday") is None
+        assert cache.get(org_b, "monday") == ["b"]
+
+    def test_evicts_oldest_entry_when_full(self):
+        """Test the oldest entry is dropped once max_entries is reached."""
+        cache = ResponseCache(ttl_seconds=60, max_entries=2)
+        org_id = uuid.uuid4()
+        cache.set(org_id, "monday", 1)
+        cache.set(org_id, "tuesday", 2)
+        cache.set(org_id, "wednesday", 3)
+
+        assert cache.get(org_id, "monday") is None
+        assert cache.get(org_id, "wednesday") == 3
@@ -3,6 +3,13 @@ Unit tests for Customer API endpoints.
 """
 
 import pytest
+from uuid import uuid4
+
+from app.dependencies.auth import AuthContext, get_current_user
+from app.main import app
+from app.models.customer import Customer
+from app.models.organization import Organization
+from app.models.tech import Tech
 
 
 @pytest.mark.unit
@@ -42,6 +49,49 @@ class TestCustomerAPI:
         assert "page" in data
         assert "page_size" in data
 
+    @pytest.mark.asyncio
+    async def test_list_customers_query_count(self, client, test_db, query_log):
+        """Test listing customers does not issue a query per customer."""
+        organization = Organization(name="Query Count Pools", slug="query-count-pools")
+        test_db.add(organization)
+        await test_db.flush()
+
+        tech = Tech(
+            organization_id=organization.id,
+            name="Listed Tech",
+            start_location_address="1 Start St, Anytown, USA",
+            end_location_address="1 Start St, Anytown, USA"
+        )
+        test_db.add(tech)
+        await test_db.flush()
+
+        for i in range(3):
+            test_db.add(Customer(
+                organization_id=organization.id,
+                name=f"Listed Pool {i}",
+                display_name=f"Listed Pool {i}",
+                address=f"{i} List St, Anytown, USA",
+                service_type="residential",
+                service_day="monday",
+                assigned_tech_id=tech.id
+            ))
+        await test_db.flush()
+
+        app.dependency_overrides[get_current_user] = lambda: AuthContext(
+            user_id=uuid4(),
+            organization_id=organization.id,
+            role="owner",
+            email="owner@example.com"
+        )
+        query_log.clear()
+
+        response = await client.get("/api/customers/")
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 3
+        # Count, page, and the assigned_tech selectin load
+        assert len(query_log) <= 3
+
     @pytest.mark.asyncio
     async def test_health_check(self, client):
         """Test health check endpoint."""
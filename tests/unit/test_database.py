@@ -0,0 +1,113 @@
+"""
+Unit tests for the database session dependency, key generation and
+schema creation.
+"""
+
+import time
+import pytest
+from sqlalchemy import create_mock_engine
+from starlette.requests import Request
+from app.database import Base, get_db, require_transaction, uuid7
+from app.models import Organization
+
+
+def make_request(method):
+    """Create a bare request with the given HTTP method."""
+    return Request({"type": "http", "method": method, "headers": [], "state": {}})
+
+
+@pytest.mark.unit
+class TestGetDb:
+    """Test session selection by request method."""
+
+    @pytest.mark.asyncio
+    async def test_read_request_uses_autocommit(self):
+        """Test GET requests get an AUTOCOMMIT session."""
+        sessions = get_db(make_request("GET"))
+        session = await sessions.__anext__()
+
+        assert session.bind.get_execution_options().get("isolation_level") == "AUTOCOMMIT"
+        await sessions.aclose()
+
+    @pytest.mark.asyncio
+    async def test_required_transaction_keeps_read_request_transactional(self):
+        """Test GET routes declaring require_transaction get a regular session."""
+        request = make_request("GET")
+        require_transaction(request)
+        sessions = get_db(request)
+        session = await sessions.__anext__()
+
+        assert "isolation_level" not in session.bind.get_execution_options()
+        await sessions.aclose()
+
+
+@pytest.mark.unit
+class TestUuid7:
+    """Test time-ordered UUID generation."""
+
+    def test_version_and_variant(self):
+        """Test generated ids are RFC 9562 version 7."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_embeds_current_time(self):
+        """Test the leading 48 bits hold the Unix time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    def test_later_ids_sort_later(self):
+        """Test ids generated in later milliseconds sort after earlier ones."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first < second
+
+
+@pytest.mark.unit
+class TestCreateAll:
+    """Test create_all builds the server-side defaults the models rely on."""
+
+    def test_emits_functions_and_updated_at_triggers(self):
+        """Test functions come before tables and server_onupdate tables get triggers."""
+        statements = []
+        engine = create_mock_engine(
+            "postgresql://",
+            lambda sql, *args, **kwargs: statements.append(str(sql.compile(dialect=engine.dialect)))
+        )
+
+        Base.metadata.create_all(engine, checkfirst=False)
+
+        first_table = next(i for i, sql in enumerate(statements) if "CREATE TABLE" in sql)
+        functions = [i for i, sql in enumerate(statements) if "CREATE OR REPLACE FUNCTION" in sql]
+        assert len(functions) == 2 and max(functions) < first_table
+
+        triggered = {
+            sql.split(" ON ")[1].split()[0]
+            for sql in statements
+            if sql.startswith("CREATE TRIGGER set_updated_at")
+        }
+        assert triggered == {
+            "customers", "issues", "organizations", "organization_users",
+            "routes", "service_catalog", "techs", "tech_routes"
+        }
+
+    @pytest.mark.asyncio
+    async def test_update_bumps_updated_at(self, test_db):
+        """Test the trigger sets updated_at when a row is updated."""
+        organization = Organization(name="Timestamped Pools", slug="timestamped-pools")
+        test_db.add(organization)
+        await test_db.commit()
+        await test_db.refresh(organization)
+        created = organization.updated_at
+
+        organization.name = "Renamed Pools"
+        await test_db.commit()
+        await test_db.refresh(organization)
+
+        assert organization.updated_at > created
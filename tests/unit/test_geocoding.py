@@ -2,9 +2,11 @@
 Unit tests for Geocoding Service.
 """
 
+import asyncio
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
-from app.services.geocoding import GeocodingService
+from app.services.geocoding import GeocodingService, haversine_miles, pairs_farther_than
+from app.services.cache import geocode_cache
 
 
 @pytest.mark.unit
@@ -99,3 +101,106 @@ class TestGeocodingService:
             assert results[0] == expected_results[0]
             assert results[1] == expected_results[1]
             assert results[2] == expected_results[2]
+
+    @pytest.mark.asyncio
+    async def test_geocode_addresses_deduplicates(self):
+        """Test concurrent geocoding looks up repeated addresses once."""
+        service = GeocodingService()
+
+        with patch.object(service, 'geocode_address', new_callable=AsyncMock) as mock_geocode:
+            mock_geocode.return_value = (40.7128, -74.0060)
+
+            result = await service.geocode_addresses("New York, NY", "New York, NY", None)
+
+            assert result == [(40.7128, -74.0060), (40.7128, -74.0060), None]
+            mock_geocode.assert_awaited_once_with("New York, NY")
+
+    @pytest.mark.asyncio
+    async def test_geocode_addresses_bounded_by_max_concurrency(self):
+        """Test concurrent geocoding runs no more lookups at once than allowed."""
+        service = GeocodingService()
+        service.max_concurrency = 1
+        in_flight = 0
+        peak = 0
+
+        async def geocode(address):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return (40.7128, -74.0060)
+
+        with patch.object(service, 'geocode_address', side_effect=geocode):
+            result = await service.geocode_addresses("Start St", "End St")
+
+        assert result == [(40.7128, -74.0060), (40.7128, -74.0060)]
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_geocode_many_keeps_order_and_errors(self):
+        """Test bounded bulk geocoding returns results and errors in input order."""
+        service = GeocodingService()
+        service.max_concurrency = 2
+        error = RuntimeError("provider down")
+
+        with patch.object(service, 'geocode_with_rate_limit', new_callable=AsyncMock) as mock_geocode:
+            mock_geocode.side_effect = [(40.7128, -74.0060), error, None]
+
+            result = [None] * 3
+            async for batch in service.geocode_many_as_completed(["A", "B", "C"]):
+                for index, value in batch:
+                    result[index] = value
+
+            assert result == [(40.7128, -74.0060), error, None]
+
+    @pytest.mark.asyncio
+    async def test_geocode_address_caches_and_coalesces(self):
+        """Test repeated and concurrent lookups of an address reach the provider once."""
+        service = GeocodingService()
+
+        with patch.object(service, '_lookup', new_callable=AsyncMock) as mock_lookup:
+            mock_lookup.return_value = (38.5816, -121.4944)
+
+            first, second = await asyncio.gather(
+                service.geocode_address("1 Main St, Sacramento"),
+                service.geocode_address("1 Main St, Sacramento")
+            )
+            third = await service.geocode_address("  1 MAIN ST,  sacramento ")
+
+            assert first == second == third == (38.5816, -121.4944)
+            mock_lookup.assert_awaited_once()
+
+        geocode_cache.invalidate_organization(None)
+
+
+@pytest.mark.unit
+class TestHaversineMiles:
+    """Test the vectorized distance calculation."""
+
+    def test_known_distances(self):
+        """Test pairwise distances match known values."""
+        distances = haversine_miles(
+            [40.7128, 38.5],
+            [-74.0060, -121.5],
+            [34.0522, 38.5],
+            [-118.2437, -121.5]
+        )
+
+        # New York to Los Angeles is about 2,445 miles; identical points are 0
+        assert distances[0] == pytest.approx(2445, rel=0.01)
+        assert distances[1] == 0
+
+    def test_pairs_farther_than_matches_haversine(self):
+        """Test the prefiltered search finds exactly the pairs past the threshold."""
+        lat1 = [38.5, 38.5, 38.5, 40.7128]
+        lon1 = [-121.5, -121.5, -121.5, -74.0060]
+        # Same point, ~4.8 miles north, ~5.2 miles north, and Los Angeles
+        lat2 = [38.5, 38.57, 38.575, 34.0522]
+        lon2 = [-121.5, -121.5, -121.5, -118.2437]
+
+        indices, distances = pairs_farther_than(lat1, lon1, lat2, lon2, threshold_miles=5.0)
+        expected = haversine_miles(lat1, lon1, lat2, lon2)
+
+        assert indices.tolist() == [2, 3]
+        assert distances.tolist() == pytest.approx(expected[[2, 3]].tolist())
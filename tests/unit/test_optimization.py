@@ -0,0 +1,106 @@
+"""
+Unit tests for Route Optimization Service.
+"""
+
+import pytest
+import uuid
+from unittest.mock import Mock
+from app.services.optimization import RouteOptimizationService
+
+
+def make_tech(max_customers_per_day=20):
+    """Create a mock tech starting and ending at the same depot."""
+    tech = Mock()
+    tech.id = uuid.uuid4()
+    tech.name = "Test Tech"
+    tech.color = "#3498db"
+    tech.start_location_address = "Depot"
+    tech.start_latitude = 38.5
+    tech.start_longitude = -121.5
+    tech.end_location_address = "Depot"
+    tech.end_latitude = 38.5
+    tech.end_longitude = -121.5
+    tech.max_customers_per_day = max_customers_per_day
+    tech.efficiency_multiplier = 1.0
+    return tech
+
+
+def make_customer(name, latitude, longitude, duration=20):
+    """Create a mock customer at the given coordinates."""
+    customer = Mock()
+    customer.id = uuid.uuid4()
+    customer.display_name = name
+    customer.name = name
+    customer.address = f"{name} address"
+    customer.latitude = latitude
+    customer.longitude = longitude
+    customer.base_service_duration = duration
+    return customer
+
+
+@pytest.mark.unit
+class TestGreedySingleTechRoute:
+    """Test the greedy shortcut for trivial single-tech routes."""
+
+    def _route(self, service, tech, customers):
+        locations, start_indices, end_indices, _, customer_start_idx = \
+            service._setup_multi_depot_locations(customers, [tech])
+        distance_matrix = service._create_distance_matrix(locations)
+        time_matrix = service._create_time_matrix(distance_matrix)
+        return service._greedy_single_tech_route(
+            distance_matrix,
+            time_matrix,
+            tech,
+            customers,
+            start_indices[0],
+            end_indices[0],
+            customer_start_idx,
+            "monday"
+        )
+
+    def test_visits_nearest_customer_first(self):
+        """Test stops are ordered by nearest neighbor from the depot."""
+        service = RouteOptimizationService()
+        far = make_customer("Far", 38.6, -121.5)
+        near = make_customer("Near", 38.51, -121.5)
+        middle = make_customer("Middle", 38.55, -121.5)
+
+        result = self._route(service, make_tech(), [far, near, middle])
+
+        stops = result["routes"][0]["stops"]
+        assert [s["customer_name"] for s in stops] == ["Near", "Middle", "Far"]
+        assert [s["sequence"] for s in stops] == [1, 2, 3]
+        assert result["summary"]["total_customers"] == 3
+        assert result["routes"][0]["total_duration_minutes"] >= 60
+
+    def test_falls_back_when_over_capacity(self):
+        """Test the shortcut defers to the solver when capacity is exceeded."""
+        service = RouteOptimizationService()
+        customers = [make_customer(f"C{i}", 38.5 + i * 0.01, -121.5) for i in range(3)]
+
+        result = self._route(service, make_tech(max_customers_per_day=2), customers)
+
+        assert result is None
+
+
+@pytest.mark.unit
+class TestTransitTimeMatrix:
+    """Test service times folded into the solver's time matrix."""
+
+    def test_adds_service_time_on_arrival_at_customers(self):
+        """Test arcs into a customer include its service time and depot arcs do not."""
+        service = RouteOptimizationService()
+        customers = [make_customer("A", 38.51, -121.5, duration=20), make_customer("B", 38.52, -121.5, duration=35)]
+        time_matrix = [
+            [0, 4, 7],
+            [4, 0, 3],
+            [7, 3, 0],
+        ]
+
+        result = service._create_transit_time_matrix(time_matrix, customers, 1)
+
+        assert result == [
+            [0, 24, 42],
+            [4, 20, 38],
+            [7, 23, 35],
+        ]
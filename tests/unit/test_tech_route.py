@@ -0,0 +1,40 @@
+"""
+Unit tests for the TechRoute stop sequence column type.
+"""
+
+import uuid
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.models.tech_route import PackedUUIDList
+
+
+@pytest.mark.unit
+class TestPackedUUIDList:
+    """Test packing stop sequences into 16-byte ids."""
+
+    def test_round_trip_preserves_order(self):
+        """Test a packed sequence reads back as the same ordered id strings."""
+        column_type = PackedUUIDList()
+        dialect = postgresql.dialect()
+        ids = [str(uuid.uuid4()) for _ in range(5)]
+
+        packed = column_type.process_bind_param(ids, dialect)
+
+        assert len(packed) == 5 * 16
+        assert column_type.process_result_value(packed, dialect) == ids
+
+    def test_accepts_uuid_objects(self):
+        """Test UUID objects pack the same as their string form."""
+        column_type = PackedUUIDList()
+        dialect = postgresql.dialect()
+        customer_id = uuid.uuid4()
+
+        assert column_type.process_bind_param([customer_id], dialect) == customer_id.bytes
+
+    def test_empty_sequence(self):
+        """Test an empty route packs to empty bytes and reads back as an empty list."""
+        column_type = PackedUUIDList()
+        dialect = postgresql.dialect()
+
+        assert column_type.process_bind_param([], dialect) == b""
+        assert column_type.process_result_value(b"", dialect) == []